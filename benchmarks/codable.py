@@ -0,0 +1,185 @@
+"""
+Nozomi
+Codable Benchmark Module
+Copyright Amatino Pty Ltd
+
+Micro-benchmark Codable decoding and encoding, per field via
+CodingDefinition, and per row via the compiled codec and the per-definition
+fallback. Usage, from the repository root:
+
+    PYTHONPATH=. python benchmarks/codable.py [--calls 200000]
+        [--rows 100000]
+
+To compare against an earlier revision, check it out into a worktree and
+run this script against it:
+
+    git worktree add /tmp/nozomi-before <revision>
+    PYTHONPATH=/tmp/nozomi-before python benchmarks/codable.py
+"""
+from nozomi.ancillary.command_line import CommandLine
+from nozomi.data.codable import Codable, CodingDefinition
+from nozomi.ancillary.immutable import Immutable
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Callable, Optional
+import timeit
+
+
+class Colour(Enum):
+    RED = 'red'
+    BLUE = 'blue'
+
+
+class Point(Codable):
+
+    coding_map = {
+        'x': CodingDefinition(int),
+        'y': CodingDefinition(int)
+    }
+
+    def __init__(self, x: int, y: int) -> None:
+        self._x = x
+        self._y = y
+        return
+
+    x = Immutable(lambda s: s._x)
+    y = Immutable(lambda s: s._y)
+
+
+class Row(Codable):
+
+    coding_map = {
+        'name': CodingDefinition(str),
+        'count': CodingDefinition(int),
+        'ratio': CodingDefinition(float),
+        'amount': CodingDefinition(Decimal),
+        'colour': CodingDefinition(Colour),
+        'origin': CodingDefinition(Point),
+        'note': CodingDefinition(str, optional=True)
+    }
+
+    def __init__(
+        self,
+        name: str,
+        count: int,
+        ratio: float,
+        amount: Decimal,
+        colour: Colour,
+        origin: Point,
+        note: Optional[str]
+    ) -> None:
+        self._name = name
+        self._count = count
+        self._ratio = ratio
+        self._amount = amount
+        self._colour = colour
+        self._origin = origin
+        self._note = note
+        return
+
+
+def _row_data(index: int) -> Any:
+    return {
+        'name': 'row ' + str(index),
+        'count': index,
+        'ratio': index / 7,
+        'amount': '12.50',
+        'colour': 'red' if index % 2 else 'blue',
+        'origin': {'x': index, 'y': -index},
+        'note': None
+    }
+
+
+def _time(function: Callable[[], Any], number: int) -> float:
+    """Return the best of three timings of `number` calls, in seconds"""
+    return min(timeit.repeat(function, number=number, repeat=3))
+
+
+def _report(name: str, seconds: float, number: int) -> None:
+    print('{n:<40} {t:>10.0f} ns'.format(
+        n=name,
+        t=seconds / number * 1e9
+    ))
+    return
+
+
+def benchmark_fields(calls: int) -> None:
+
+    cases = (
+        ('CodingDefinition.decode str', CodingDefinition(str), 'value'),
+        ('CodingDefinition.decode enum', CodingDefinition(Colour), 'red'),
+        (
+            'CodingDefinition.decode decimal',
+            CodingDefinition(Decimal),
+            '12.50'
+        ),
+        (
+            'CodingDefinition.decode codable',
+            CodingDefinition(Point),
+            {'x': 1, 'y': 2}
+        )
+    )
+
+    print('Per field, {c} calls:'.format(c=str(calls)))
+    for name, definition, data in cases:
+        _report(name, _time(lambda: definition.decode(data), calls), calls)
+        continue
+
+    row = Row.decode(_row_data(1))
+    _report(
+        'Codable.encode, per mixed type field',
+        _time(row.encode, calls) / len(Row.coding_map),
+        calls
+    )
+
+    return
+
+
+def benchmark_rows(rows: int) -> None:
+
+    data = [_row_data(i) for i in range(rows)]
+    decoded = Row.decode_many(data)
+
+    print('Per {r} rows of {f} fields:'.format(
+        r=str(rows),
+        f=str(len(Row.coding_map))
+    ))
+    print('{n:<40} {t:>10.3f} s'.format(
+        n='Codable.decode_many',
+        t=_time(lambda: Row.decode_many(data), 1)
+    ))
+    # Revisions preceding the compiled codec decode by definition only
+    if hasattr(Row, '_decode_by_definition'):
+        print('{n:<40} {t:>10.3f} s'.format(
+            n='Codable._decode_by_definition',
+            t=_time(
+                lambda: [Row._decode_by_definition(d) for d in data],
+                1
+            )
+        ))
+    print('{n:<40} {t:>10.3f} s'.format(
+        n='Codable.encode',
+        t=_time(lambda: [r.encode() for r in decoded], 1)
+    ))
+
+    return
+
+
+def main() -> None:
+
+    command_line = CommandLine.load()
+
+    benchmark_fields(command_line.optionally_parse_int(
+        '--calls',
+        min_value=1
+    ) or 200000)
+    benchmark_rows(command_line.optionally_parse_int(
+        '--rows',
+        min_value=1
+    ) or 100000)
+
+    return
+
+
+if __name__ == '__main__':
+    main()
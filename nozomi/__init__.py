@@ -6,10 +6,13 @@ from nozomi.ancillary.file_content import FileBody
 from nozomi.ancillary.command_line import CommandLine
 
 from nozomi.data.datastore import Datastore
+from nozomi.data.pooled_datastore import PooledDatastore
+from nozomi.data.async_datastore import AsyncDatastore
 from nozomi.data.encodable import Encodable
 from nozomi.data.abstract_encodable import AbstractEncodable
 from nozomi.data.format import Format
 from nozomi.data.encoder import Encoder
+from nozomi.data.json_serialiser import JSONSerialiser
 from nozomi.data.decodable import Decodable
 from nozomi.data.codable import Codable
 from nozomi.data.codable import CodingDefinition
@@ -44,6 +47,8 @@ from nozomi.errors.not_authorised import NotAuthorised
 from nozomi.errors.not_authenticated import NotAuthenticated
 from nozomi.errors.already_exists import AlreadyExists
 from nozomi.errors.too_many_requests import TooManyRequests
+from nozomi.errors.schema_violation import SchemaViolation
+from nozomi.errors.not_modified import NotModified
 
 from nozomi.http.abstract_headers import AbstractHeaders
 from nozomi.http.headers import Headers
@@ -51,11 +56,17 @@ from nozomi.http.method import HTTPMethod
 from nozomi.http.query_string import QueryString
 from nozomi.http.status_code import HTTPStatusCode
 from nozomi.http.parseable_data import ParseableData
+from nozomi.http.request_schema import RequestSchema, SchemaField, StringField
+from nozomi.http.request_schema import IntegerField, FloatField, DecimalField
+from nozomi.http.request_schema import BooleanField, EnumField, ArrayField
+from nozomi.http.request_schema import SchemaRecord
 from nozomi.http.content_type import ContentType
 from nozomi.http.redirect import Redirect
 from nozomi.http.url_parameter import URLParameter, QueryParameter
 from nozomi.http.url_parameters import URLParameters, QueryParameters
 from nozomi.http.api_request import ApiRequest
+from nozomi.http.connection_pool import ConnectionPool
+from nozomi.http.response_cache import ResponseCache
 from nozomi.http.user_agent import UserAgent
 from nozomi.http.character import Character
 from nozomi.http.request_body import RequestBody
@@ -93,10 +104,14 @@ from nozomi.security.read_protected import ReadProtected
 from nozomi.security.random_number import RandomNumber
 from nozomi.security.salt import Salt
 from nozomi.security.secret import Secret
+from nozomi.security.hashing_pool import HashingPool
+from nozomi.security.hash_parameters import HashParameters
 from nozomi.security.cors_policy import CORSPolicy
 from nozomi.security.access_control import AccessControl
 from nozomi.security.cookie_headers import CookieHeaders
 from nozomi.security.abstract_session import AbstractSession
+from nozomi.security.session_cache import SessionCache
+from nozomi.security.session_touch_buffer import SessionTouchBuffer
 from nozomi.security.request_credentials import RequestCredentials
 from nozomi.security.forwarded_agent import ForwardedAgent
 
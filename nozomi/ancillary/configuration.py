@@ -24,6 +24,10 @@ class Configuration:
     public_api_endpoint: str = Immutable(
         lambda s: s.api_endpoint
     )
+    api_pool_size: int = 8
+    api_timeout_seconds: float = 30
+    api_idle_seconds: float = 30
+    api_cache_bytes: int = 0
 
     # Sessions
 
@@ -32,6 +36,11 @@ class Configuration:
     session_cookie_key_name: str = NotImplemented
     session_id_name: str = NotImplemented
     session_flag_cookie_name: str = NotImplemented
+    session_cache_seconds: int = 0
+    session_cache_capacity: int = 1024
+    session_cache_channel: Optional[str] = None
+    session_write_behind_milliseconds: int = 0
+    session_write_behind_capacity: int = 1000
 
     internal_psk_header: str = NotImplemented
     internal_psk: Optional[InternalKey] = NotImplemented
@@ -43,6 +52,9 @@ class Configuration:
     standard_js_scripts: List[Union[str, Script]] = NotImplemented
 
     database_credentials: DatabaseCredentials = NotImplemented
+    database_minimum_connections: int = 1
+    database_maximum_connections: int = 8
+    database_checkout_timeout: float = 30
 
     api_agent: Agent = NotImplemented
 
@@ -52,6 +64,11 @@ class Configuration:
     disable_cors_restriction: bool = NotImplemented
     development_origins: Optional[List[str]] = None
 
+    # Serialisation
+    json_backend: str = 'standard'
+    compact_json: bool = False
+    stream_chunk_size: int = 16384
+
     # Other
     server_name: str = NotImplemented
     boundary_ip_header: str = NotImplemented
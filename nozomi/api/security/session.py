@@ -18,19 +18,46 @@ from nozomi.security.agent import Agent
 from nozomi.security.credentials import Credentials
 from nozomi.security.cookies import Cookies
 from nozomi.http.headers import Headers
-from typing import Any, Dict, TypeVar, Type, Optional
+from typing import Any, Dict, TypeVar, Type, Optional, List
 from nozomi.ancillary.configuration import Configuration
 from nozomi.security.abstract_session import AbstractSession
+from nozomi.security.session_cache import SessionCache
+from nozomi.security.session_touch_buffer import Touch
+from nozomi.data.pooled_datastore import PooledDatastore
+import threading
 import hmac
 
 T = TypeVar('T', bound='Session')
 
+_CACHE_LOCK = threading.Lock()
+
 
 class Session(Encodable, AbstractSession):
+    """
+    A Session authenticating an Agent. If `Configuration.session_cache_seconds`
+    is non-zero, retrieved Sessions are cached in-process, though supplied
+    credentials are always compared against the Session. Deleting a Session
+    invalidates it in this process, and in any process listening on
+    `Configuration.session_cache_channel`.
+
+    If `Configuration.session_write_behind_milliseconds` is non-zero, each
+    authenticated Session is touched, and last-utilised times are written
+    in batches via `queries/session/touch.sql`, which should contain an
+    `UPDATE ... FROM (VALUES %s) AS touched (session_id, last_utilised)`.
+    Writes use the PooledDatastore first supplied to `.from_headers()`.
+    The retrieval query then need not write.
+
+    Caching requires write-behind, as cached Sessions are not retrieved,
+    and so are only recorded as utilised by touches.
+    """
 
     _Q_DELETE = Query.optionally_from_file('queries/session/delete.sql')
-    _Q_RETRIEVE = Query.optionally_from_file('queries/session/retrieve.sql')
+    _Q_RETRIEVE = Query.optionally_from_file(
+        'queries/session/retrieve.sql',
+        prepare=True
+    )
     _Q_CREATE = Query.optionally_from_file('queries/session/create.sql')
+    _Q_TOUCH = Query.optionally_from_file('queries/session/touch.sql')
 
     def __init__(
         self,
@@ -72,6 +99,46 @@ class Session(Encodable, AbstractSession):
 
     agent_id = Immutable(lambda s: s._agent.agent_id)
 
+    _session_cache: Optional[SessionCache] = None
+
+    @classmethod
+    def _cache_for(
+        cls: Type[T],
+        configuration: Configuration,
+        datastore: Datastore
+    ) -> Optional[SessionCache]:
+        """Return this class' SessionCache, if caching is configured"""
+        if not configuration.session_cache_seconds:
+            return None
+        cache = cls.__dict__.get('_session_cache')
+        if cache is not None:
+            return cache
+        if cls.touch_buffer(configuration, datastore) is None:
+            raise RuntimeError('Session caching requires write-behind. Set \
+Configuration.session_write_behind_milliseconds, and supply a \
+PooledDatastore')
+        with _CACHE_LOCK:
+            cache = cls.__dict__.get('_session_cache')
+            if cache is None:
+                cache = SessionCache.from_configuration(configuration)
+                cls._session_cache = cache
+        return cache
+
+    @classmethod
+    def write_touches(
+        cls: Type[T],
+        configuration: Configuration,
+        datastore: PooledDatastore,
+        touches: List[Touch]
+    ) -> None:
+        with datastore.checkout():
+            cls._load_query(cls._Q_TOUCH).execute_values(
+                datastore,
+                touches,
+                atomic=True
+            )
+        return
+
     @classmethod
     def _load_query(cls: Type[T], query: Optional[Query]) -> Query:
         if query is None:
@@ -110,6 +177,15 @@ class Session(Encodable, AbstractSession):
         }
         query = self._load_query(self._Q_DELETE)
         query.execute(datastore, arguments, atomic=True)
+        cache = self._cache_for(configuration, datastore)
+        if cache is not None:
+            cache.invalidate(self._session_id)
+        if configuration.session_cache_channel is not None:
+            SessionCache.notify(
+                datastore,
+                configuration.session_cache_channel,
+                self._session_id
+            )
         return None
 
     def encode(self) -> Dict[str, Any]:
@@ -164,6 +240,7 @@ class Session(Encodable, AbstractSession):
             return None
         if not session._finds_api_key_authentic(credentials.api_key):
             return None
+        session.touch(configuration, datastore)
         return session
 
     @classmethod
@@ -203,6 +280,7 @@ class Session(Encodable, AbstractSession):
             return None
         if not session._finds_session_key_authentic(session_key):
             return None
+        session.touch(configuration, datastore)
         return session
 
     @classmethod
@@ -247,6 +325,12 @@ class Session(Encodable, AbstractSession):
         assert secret_check is True  # Redundant sanity check
         assert secret.agent_id is not None
 
+        try:
+            secret.upgrade(provided_plaintext_secret, datastore)
+        except Exception:
+            datastore.rollback()
+            raise
+
         input_data = {
             'session_id': RandomNumber(128).urlsafe_base64.replace('=', ''),
             'session_key': RandomNumber(192).urlsafe_base64.replace('=', ''),
@@ -309,6 +393,15 @@ class Session(Encodable, AbstractSession):
     ) -> Optional[T]:
 
         assert isinstance(session_id, str)
+
+        cache = None
+        if in_transaction is False:
+            cache = cls._cache_for(configuration, datastore)
+        if cache is not None:
+            session = cache.get(session_id)
+            if session is not None:
+                return session
+
         arguments = {
             'session_id': session_id,
             'seconds_to_live': configuration.session_seconds_to_live
@@ -321,4 +414,7 @@ class Session(Encodable, AbstractSession):
         datastore.commit()
         if result is None:
             return None
-        return cls.decode(result)
+        session = cls.decode(result)
+        if cache is not None:
+            cache.add(session)
+        return session
@@ -105,7 +105,7 @@ class Session(AbstractSession):
             path=self.API_PATH,
             method=HTTPMethod.DELETE,
             configuration=configuration,
-            credentials=RequestCredentials,
+            credentials=credentials,
             data=None,
             url_parameters=parameters
         )
@@ -189,6 +189,7 @@ Nozomi Application')
         if not session._authenticate_headers(headers, configuration):
             return None
 
+        session.touch(configuration)
         return session
 
     @classmethod
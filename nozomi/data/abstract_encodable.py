@@ -3,7 +3,7 @@ Nozomi
 Abstract Encodable Module
 author: hugh@blinkybeach.com
 """
-from typing import Any, TypeVar, Type, List
+from typing import Any, TypeVar, Type, List, Optional
 from nozomi.data.format import Format
 from nozomi.data.format import Constants as Formats
 
@@ -16,10 +16,16 @@ class AbstractEncodable:
         """Return a JSON-serialisable form of the object"""
         raise NotImplementedError
 
-    def serialise(self, format: Format = Formats.JSON) -> str:
+    def serialise(
+        self,
+        format: Format = Formats.JSON,
+        serialiser: Optional[Any] = None
+    ) -> str:
         """
         Return a string encoded representation of the object in the
-        supplied format
+        supplied format, optionally via a supplied JSONSerialiser.
+        Resources supply a serialiser only to objects that do not override
+        `Encodable.serialise`, such that overrides need not accept one.
         """
         raise NotImplementedError
 
@@ -0,0 +1,185 @@
+"""
+Nozomi
+Async Datastore Module
+Copyright Amatino Pty Ltd
+"""
+from nozomi.ancillary.immutable import Immutable
+from nozomi.ancillary.database_credentials import DatabaseCredentials
+from nozomi.data.sql_conforming import AnySQLConforming, SQLConforming
+from typing import Type, TypeVar, Any, Optional, Dict, AsyncIterator
+
+try:
+    from contextlib import asynccontextmanager
+    from contextvars import ContextVar
+except ImportError:
+    # Python 3.6. AsyncDatastore requires Python 3.7 or later, but importing
+    # this module must not fail on earlier versions.
+    def asynccontextmanager(function: Any) -> Any:
+        return function
+    ContextVar = None
+
+try:
+    from psycopg import AsyncClientCursor
+    from psycopg.adapt import Dumper
+    from psycopg_pool import AsyncConnectionPool
+except ImportError:
+    AsyncClientCursor = None
+    Dumper = object
+    AsyncConnectionPool = None
+
+T = TypeVar('T', bound='AsyncDatastore')
+
+
+class _SQLConformingDumper(Dumper):
+    """
+    Adapts SQLConforming objects for psycopg 3. `.dump()` returns the
+    adapted, unquoted value, and `.quote()` the quoted literal used in
+    client-side parameter binding.
+    """
+
+    def dump(self, obj: SQLConforming) -> bytes:
+        return obj.copy_text().encode('utf-8')
+
+    def quote(self, obj: SQLConforming) -> bytes:
+        literal = obj.getquoted()
+        if isinstance(literal, str):
+            return literal.encode('utf-8')
+        return literal
+
+
+class AsyncDatastore:
+    """
+    An abstraction of a persistent data storage layer, accessed via asyncio
+    over a pool of psycopg 3 connections. Queries use the same
+    `%(name)s` argument syntax as the synchronous Datastore.
+
+    Outside of a `.transaction()` block, each execution checks out a pooled
+    connection and commits on completion.
+    """
+
+    def __init__(
+        self,
+        credentials: DatabaseCredentials,
+        debug: bool = False,
+        minimum_connections: int = 1,
+        maximum_connections: int = 8
+    ) -> None:
+
+        if ContextVar is None:
+            raise NotImplementedError('AsyncDatastore requires Python 3.7+')
+        if not AsyncConnectionPool:
+            raise NotImplementedError('Install psycopg and psycopg-pool')
+
+        assert isinstance(credentials, DatabaseCredentials)
+
+        self._credentials = credentials
+        self._debug = debug
+        self._transaction: ContextVar = ContextVar(
+            'nozomi_async_transaction',
+            default=None
+        )
+        self._pool = AsyncConnectionPool(
+            credentials.dsn_string,
+            min_size=minimum_connections,
+            max_size=maximum_connections,
+            kwargs={'cursor_factory': AsyncClientCursor},
+            configure=self._configure,
+            open=False
+        )
+
+        return
+
+    debug = Immutable(lambda s: s._debug)
+
+    @staticmethod
+    async def _configure(connection: Any) -> None:
+        connection.adapters.register_dumper(
+            SQLConforming,
+            _SQLConformingDumper
+        )
+        return
+
+    async def open(self) -> None:
+        """Open the underlying connection pool"""
+        await self._pool.open()
+        return
+
+    async def refresh(self) -> None:
+        """Check pooled connections, replacing any that are broken"""
+        await self._pool.check()
+        return
+
+    async def close(self) -> None:
+        await self._pool.close()
+        return
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[T]:
+        """
+        Execute all queries awaited inside an `async with` block on a single
+        connection, committing on exit or rolling back on exception
+        """
+        if self._transaction.get() is not None:
+            raise RuntimeError('Transaction already in progress')
+        async with self._pool.connection() as connection:
+            token = self._transaction.set(connection)
+            try:
+                yield self
+            finally:
+                self._transaction.reset(token)
+
+    async def execute(
+        self,
+        query: str,
+        arguments: Optional[Dict[str, AnySQLConforming]] = None,
+        atomic: bool = False
+    ) -> Optional[Any]:
+        """
+        Execute a supplied SQL query string with the supplied arguments,
+        returning the first column of the first row, if any. Atomic queries
+        inside a transaction are committed immediately.
+        """
+        connection = self._transaction.get()
+        if connection is not None:
+            result = await self._execute(connection, query, arguments)
+            if atomic is True:
+                await connection.commit()
+            return result
+
+        async with self._pool.connection() as connection:
+            return await self._execute(connection, query, arguments)
+
+    @staticmethod
+    async def _execute(
+        connection: Any,
+        query: str,
+        arguments: Optional[Dict[str, AnySQLConforming]]
+    ) -> Optional[Any]:
+
+        async with connection.cursor() as cursor:
+            await cursor.execute(query, arguments)
+            if cursor.description is None:
+                return None
+            result = await cursor.fetchone()
+
+        if result is None:
+            return None
+        return result[0]
+
+    async def mogrify(
+        self,
+        query: str,
+        arguments: Optional[Dict[str, Any]]
+    ) -> str:
+        """Return a string compiled query"""
+        async with self._pool.connection() as connection:
+            return connection.cursor().mogrify(query, arguments)
+
+    @classmethod
+    def from_config(cls: Type[T], configuration: Any) -> T:
+        return cls(
+            configuration.database_credentials,
+            configuration.debug,
+            minimum_connections=configuration.database_minimum_connections,
+            maximum_connections=configuration.database_maximum_connections
+        )
@@ -5,6 +5,7 @@ author: hugh@blinkybeach.com
 """
 import sys
 import json
+import keyword
 from nozomi.data.encodable import Encodable
 from nozomi.data.decodable import Decodable
 from typing import TypeVar, Type, Any, Union, Dict, Optional, List
@@ -45,11 +46,15 @@ class CodingDefinition:
         default_value_generator: Optional[Callable[[], CodableType]] = None
     ) -> None:
 
+        is_enum = _recurse_bases(Enum, codable_type)
+        is_decimal = codable_type == Decimal
+        is_codable = _recurse_bases(Codable, codable_type)
+
         if (
                 codable_type not in _QUANTUM_TYPES
-                and not _recurse_bases(Enum, codable_type)
-                and codable_type != Decimal
-                and not _recurse_bases(Codable, codable_type)
+                and not is_enum
+                and not is_decimal
+                and not is_codable
         ):
             raise TypeError('CodingDefinition  requires that the `codable_type\
 ` parameter be one of either (int, str, float, bool, dict, list, Enum, Decimal\
@@ -65,6 +70,9 @@ type {x} does not appear to meet these requirements.\
         self._optional = optional
         self._array = array
         self._default_value = default_value
+        self._is_enum = is_enum
+        self._is_decimal = is_decimal and not is_enum
+        self._is_codable = is_codable and not (is_enum or is_decimal)
 
         return
 
@@ -79,15 +87,15 @@ type {x} does not appear to meet these requirements.\
                     return None
                 raise RuntimeError('Unexpectedly null data when decoding')
 
-            if _recurse_bases(Enum, self._codable_type):
+            if self._is_enum is True:
                 if self._array is True:
                     return [self._codable_type(d) for d in data]
                 return self._codable_type(data)
 
-            if self._codable_type == Decimal:
+            if self._is_decimal is True:
                 return Decimal(data)
 
-            if not _recurse_bases(Codable, self._codable_type):
+            if self._is_codable is False:
                 return data
 
             if self._array is True and self._optional is True:
@@ -109,44 +117,277 @@ type {x} does not appear to meet these requirements.\
             raise
 
 
-class Codable(Encodable, Decodable):
+_MISSING = object()
 
-    coding_map: Dict[str, CodingDefinition] = NotImplemented
-    codable_debug_target = False
 
-    def encode(self):
+class _NullData(Exception):
+    """Raised by a compiled decoder when it encounters missing data"""
+    pass
+
+
+def _encode_attribute(attribute: Optional[CodableType]) -> Optional[Any]:
+    """Return a JSON-serialisable form of an arbitrary Codable attribute"""
+
+    if attribute is None:
+        return None
+
+    kind = type(attribute)
+    encoder = _ATTRIBUTE_ENCODERS.get(kind)
+    if encoder is None:
+        encoder = _classify_attribute_type(kind)
+        _ATTRIBUTE_ENCODERS[kind] = encoder
+
+    return encoder(attribute)
+
+
+def _classify_attribute_type(kind: Type) -> Callable[[Any], Any]:
+    """Return a function encoding attributes of the supplied type"""
+
+    if kind in (int, str, float, bool):
+        return lambda a: a
+
+    if issubclass(kind, Enum):
+        return lambda a: _encode_attribute(a.value)
+
+    if issubclass(kind, Decimal):
+        return str
+
+    if issubclass(kind, dict):
+        return lambda a: {k: _encode_attribute(a[k]) for k in a}
+
+    if issubclass(kind, list):
+        return lambda a: [_encode_attribute(i) for i in a]
+
+    if _recurse_bases(Codable, kind):
+        return lambda a: a.encode()
+
+    def unexpected(attribute: Any) -> None:
+        raise RuntimeError('Unexpected type: ' + str(attribute))
+
+    return unexpected
+
+
+_ATTRIBUTE_ENCODERS: Dict[Type, Callable[[Any], Any]] = dict()
+
+
+class _Codec:
+    """
+    A decoder and encoder specialised for a single Codable subclass. Type
+    checks implied by the class coding map are resolved once, when the
+    codec is compiled, rather than for each field of each object.
+    """
 
-        def recurse(
-            attribute: Optional[CodableType]
-        ) -> Optional[CodableType]:
+    _PRIMITIVES = (int, str, float, bool)
 
-            if attribute is None:
-                return None
+    def __init__(self, codable: Type['Codable']) -> None:
 
-            if type(attribute) in (int, str, float, bool):
-                return attribute
+        self.codable = codable
+        self.coding_map = codable.coding_map
+        namespace: Dict[str, Any] = {
+            'cls': codable,
+            '_NullData': _NullData,
+            '_MISSING': _MISSING,
+            '_e': _encode_attribute,
+            '_P': self._PRIMITIVES,
+            '_Enum': Enum,
+            '_Decimal': Decimal,
+            '_Codable': Codable
+        }
 
-            if isinstance(attribute, Enum):
-                return recurse(attribute.value)
+        decoder = ['def decode(data):']
+        encoder = ['def encode(self):', '    d = self.__dict__']
+        arguments: List[str] = list()
 
-            if isinstance(attribute, Decimal):
-                return str(attribute)
+        for index, (key, definition) in enumerate(self.coding_map.items()):
+            value = 'v' + str(index)
+            kind = 't' + str(index)
+            namespace[kind] = definition._codable_type
+            namespace['d' + str(index)] = definition._default_value
+            decoder += self._decode_lines(
+                key,
+                definition,
+                value,
+                kind,
+                'd' + str(index)
+            )
+            arguments.append(key)
+            encoder += [
+                '    ' + value + ' = d[' + repr('_' + key) + ']',
+                '    ' + value + ' = ' + self._encode_expression(
+                    definition,
+                    value
+                )
+            ]
+            continue
+
+        if False in [
+            k.isidentifier() and not keyword.iskeyword(k) for k in arguments
+        ]:
+            decoder.append('    return cls(**{' + ', '.join([
+                repr(k) + ': v' + str(i) for i, k in enumerate(arguments)
+            ]) + '})')
+        else:
+            decoder.append('    return cls(' + ', '.join([
+                k + '=v' + str(i) for i, k in enumerate(arguments)
+            ]) + ')')
+
+        encoder.append('    return {' + ', '.join([
+            repr(k) + ': v' + str(i) for i, k in enumerate(arguments)
+        ]) + '}')
+
+        exec('\n'.join(decoder), namespace)
+        exec('\n'.join(encoder), namespace)
+
+        self.decode: Callable[[Any], Any] = namespace['decode']
+        self.encode: Callable[[Any], Any] = namespace['encode']
+
+        return
 
-            if isinstance(attribute, dict):
-                return {k: recurse(attribute[k]) for k in attribute}
+    @staticmethod
+    def _decode_lines(
+        key: str,
+        definition: 'CodingDefinition',
+        value: str,
+        kind: str,
+        default: str
+    ) -> List[str]:
+
+        conversion: Optional[str] = None
+
+        if definition._is_enum is True:
+            if definition._array is True:
+                conversion = '[' + kind + '(x) for x in ' + value + ']'
+            else:
+                conversion = kind + '(' + value + ')'
+        elif definition._is_decimal is True:
+            conversion = '_Decimal(' + value + ')'
+        elif definition._is_codable is True:
+            if definition._array is True and definition._optional is True:
+                conversion = kind + '.optionally_decode_many(' + value + ', \
+default_to_empty_list=True)'
+            elif definition._array is True:
+                conversion = kind + '.decode_many(' + value + ')'
+            elif definition._optional is True:
+                conversion = kind + '.optionally_decode(' + value + ')'
+            else:
+                conversion = kind + '.decode(' + value + ')'
+
+        lines = [
+            '    ' + value + ' = data.get(' + repr(key) + ', _MISSING)',
+            '    if ' + value + ' is _MISSING:',
+            '        raise _NullData'
+        ]
+
+        if definition._optional is True:
+            lines += [
+                '    if ' + value + ' is None:',
+                '        ' + value + ' = ' + default
+            ]
+            if conversion is not None:
+                lines += [
+                    '    else:',
+                    '        ' + value + ' = ' + conversion
+                ]
+            return lines
+
+        lines += [
+            '    if ' + value + ' is None:',
+            '        raise _NullData'
+        ]
+        if conversion is not None:
+            lines.append('    ' + value + ' = ' + conversion)
+        return lines
+
+    @staticmethod
+    def _encode_expression(
+        definition: 'CodingDefinition',
+        value: str
+    ) -> str:
+
+        codable_type = definition._codable_type
+        fallback = ' else _e(' + value + ')'
+
+        if definition._array is True:
+            if definition._is_codable is True:
+                return '[x.encode() if isinstance(x, _Codable) else _e(x) \
+for x in ' + value + '] if ' + value + '.__class__ is list' + fallback
+            return '_e(' + value + ')'
+
+        if codable_type in _Codec._PRIMITIVES:
+            return value + ' if ' + value + '.__class__ in _P' + fallback
+
+        if definition._is_enum is True:
+            return value + '.value if isinstance(' + value + ', _Enum) and \
+' + value + '.value.__class__ in _P' + fallback
+
+        if definition._is_decimal is True:
+            return 'str(' + value + ') if isinstance(' + value + ', \
+_Decimal)' + fallback
+
+        if definition._is_codable is True:
+            return value + '.encode() if isinstance(' + value + ', \
+_Codable)' + fallback
+
+        return '_e(' + value + ')'
+
+    @classmethod
+    def for_class(cls, codable: Type['Codable']) -> '_Codec':
+        """Return the codec for a Codable subclass, compiling it if need be"""
+        codec = codable._codable_codec
+        if (
+                codec is None
+                or codec.codable is not codable
+                or codec.coding_map is not codable.coding_map
+        ):
+            codec = cls(codable)
+            codable._codable_codec = codec
+        return codec
 
-            if isinstance(attribute, list):
-                return [recurse(a) for a in attribute]
 
-            if _recurse_bases(Codable, type(attribute)):
-                return attribute.encode()
+class Codable(Encodable, Decodable):
 
-            raise RuntimeError('Unexpected type: ' + str(attribute))
+    coding_map: Dict[str, CodingDefinition] = NotImplemented
+    codable_debug_target = False
+    _codable_codec: Optional[_Codec] = None
 
-        return {k: recurse(self.__dict__['_' + k]) for k in self.coding_map}
+    def encode(self):
+        return _Codec.for_class(type(self)).encode(self)
 
     @classmethod
     def decode(cls: Type[T], data: Any) -> T:
+        if cls.codable_debug_target is True:
+            return cls._decode_by_definition(data)
+        try:
+            return _Codec.for_class(cls).decode(data)
+        except _NullData:
+            return cls._decode_by_definition(data)
+        except Exception:
+            if '--debug' in sys.argv or '--test' in sys.argv:
+                return cls._decode_by_definition(data)
+            raise
+
+    @classmethod
+    def decode_many(cls: Type[T], data: Any) -> List[T]:
+        if (
+                cls.codable_debug_target is True
+                or cls.decode.__func__ is not Codable.decode.__func__
+        ):
+            return [cls.decode(d) for d in data]
+        # Materialise the data first, as it may be a generator, which the
+        # diagnostic fallback would otherwise find partially consumed
+        data = data if isinstance(data, list) else list(data)
+        decode = _Codec.for_class(cls).decode
+        try:
+            return [decode(d) for d in data]
+        except Exception:
+            return [cls.decode(d) for d in data]
+
+    @classmethod
+    def _decode_by_definition(cls: Type[T], data: Any) -> T:
+        """
+        Decode field by field via each CodingDefinition. Slower than the
+        compiled codec, but yields detailed diagnostics on failure.
+        """
         c = cls.coding_map
         if cls.codable_debug_target is True:
             print('decode data: ')
@@ -0,0 +1,119 @@
+"""
+Nozomi
+Copy Stream Module
+Copyright Amatino Pty Ltd
+"""
+from nozomi.data.sql_conforming import SQLConforming
+from collections.abc import Mapping
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Iterable, List, Sequence, Union
+import json
+
+_ESCAPES = str.maketrans({
+    '\\': '\\\\',
+    '\t': '\\t',
+    '\n': '\\n',
+    '\r': '\\r'
+})
+
+Row = Union[Mapping, Sequence]
+
+
+class CopyStream:
+    """
+    A read-only, file-like stream of rows in the text format of the SQL
+    COPY command. Rows are consumed lazily as the stream is read, so an
+    arbitrarily large iterable may be copied with bounded memory.
+    """
+
+    def __init__(
+        self,
+        rows: Iterable[Row],
+        columns: List[str]
+    ) -> None:
+
+        assert isinstance(columns, list)
+
+        self._rows = iter(rows)
+        self._columns = columns
+        self._buffer = ''
+        self._exhausted = False
+
+        return
+
+    def read(self, size: int = -1) -> str:
+        while not self._exhausted and (
+            size < 0 or len(self._buffer) < size
+        ):
+            try:
+                row = next(self._rows)
+            except StopIteration:
+                self._exhausted = True
+                break
+            self._buffer += self._line(row)
+            continue
+
+        if size < 0:
+            size = len(self._buffer)
+        output = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return output
+
+    def _line(self, row: Row) -> str:
+        if isinstance(row, Mapping):
+            values = [row[c] for c in self._columns]
+        else:
+            values = row
+        if len(values) != len(self._columns):
+            raise ValueError('Row length does not match COPY columns')
+        return '\t'.join([self.text_for(v) for v in values]) + '\n'
+
+    @staticmethod
+    def text_for(value: Any) -> str:
+        """
+        Return a COPY text format representation of a value. Mappings are
+        written as JSON, and lists and tuples as array literals, such that
+        they may be copied into json and array columns respectively.
+        """
+        if value is None:
+            return '\\N'
+        if isinstance(value, Enum):
+            return CopyStream.text_for(value.value)
+        return CopyStream._text(value).translate(_ESCAPES)
+
+    @staticmethod
+    def array_literal(values: Sequence[Any]) -> str:
+        """
+        Return a Postgres array literal of a sequence of values, before
+        COPY escapes are applied, nesting arrays for nested sequences
+        """
+        elements: List[str] = list()
+        for value in values:
+            if isinstance(value, Enum):
+                value = value.value
+            if value is None:
+                elements.append('NULL')
+            elif isinstance(value, (list, tuple)):
+                elements.append(CopyStream.array_literal(value))
+            else:
+                elements.append('"' + CopyStream._text(value).replace(
+                    '\\', '\\\\'
+                ).replace('"', '\\"') + '"')
+            continue
+        return '{' + ','.join(elements) + '}'
+
+    @staticmethod
+    def _text(value: Any) -> str:
+        # The text of a non-null value, before COPY escapes are applied
+        if isinstance(value, bool):
+            return 't' if value else 'f'
+        if isinstance(value, SQLConforming):
+            return value.copy_text()
+        if isinstance(value, (datetime, date)):
+            return value.isoformat()
+        if isinstance(value, Mapping):
+            return json.dumps(value)
+        if isinstance(value, (list, tuple)):
+            return CopyStream.array_literal(value)
+        return str(value)
@@ -0,0 +1,138 @@
+"""
+Nozomi
+Database Connection Pool Module
+Copyright Amatino Pty Ltd
+"""
+from nozomi.ancillary.immutable import Immutable
+from typing import Any, List
+import threading
+import time
+
+try:
+    import psycopg2
+    from psycopg2.pool import PoolError
+    from psycopg2.extensions import TRANSACTION_STATUS_IDLE
+    from psycopg2.extensions import TRANSACTION_STATUS_UNKNOWN
+except ImportError:
+    psycopg2 = None
+    PoolError = None
+    TRANSACTION_STATUS_IDLE = None
+    TRANSACTION_STATUS_UNKNOWN = None
+
+
+class DatabaseConnectionPool:
+    """
+    A threadsafe pool of psycopg2 connections. At most `maximum`
+    connections are open at once, and every connection returned in good
+    order is kept idle for reuse, such that checking a connection out and
+    back per request does not reconnect. `minimum` connections are opened
+    up front.
+
+    Checking out a connection while `maximum` are in use waits up to
+    `timeout` seconds for one to be returned, then raises PoolError.
+    """
+
+    def __init__(
+        self,
+        dsn: str,
+        minimum: int,
+        maximum: int,
+        timeout: float = 30
+    ) -> None:
+
+        if not psycopg2:
+            raise NotImplementedError('Install Psycopg2')
+
+        assert 0 <= minimum <= maximum
+        assert maximum > 0
+
+        self._dsn = dsn
+        self._maximum = maximum
+        self._timeout = timeout
+        self._idle: List[Any] = list()
+        self._open = 0
+        self._closed = False
+        self._condition = threading.Condition()
+
+        for _ in range(minimum):
+            self._idle.append(psycopg2.connect(dsn))
+            self._open += 1
+            continue
+
+        return
+
+    maximum: int = Immutable(lambda s: s._maximum)
+    timeout: float = Immutable(lambda s: s._timeout)
+    open_connections: int = Immutable(lambda s: s._open)
+    idle_connections: int = Immutable(lambda s: len(s._idle))
+
+    def getconn(self) -> Any:
+        """
+        Return an idle connection, or a new one if fewer than `maximum` are
+        open, waiting up to `timeout` seconds for one to become available
+        """
+        deadline = time.monotonic() + self._timeout
+        with self._condition:
+            while True:
+                if self._closed is True:
+                    raise PoolError('Connection pool is closed')
+                if self._idle:
+                    return self._idle.pop()
+                if self._open < self._maximum:
+                    self._open += 1
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise PoolError('Timed out awaiting a connection')
+                self._condition.wait(remaining)
+                continue
+
+        try:
+            return psycopg2.connect(self._dsn)
+        except BaseException:
+            with self._condition:
+                self._open -= 1
+                self._condition.notify()
+            raise
+
+    def putconn(self, connection: Any, close: bool = False) -> None:
+        """
+        Return a connection to the pool, rolling back any uncommitted work,
+        or close it if requested or if it is unusable
+        """
+        if close is False and connection.closed == 0:
+            try:
+                status = connection.get_transaction_status()
+                if status == TRANSACTION_STATUS_UNKNOWN:
+                    close = True
+                elif status != TRANSACTION_STATUS_IDLE:
+                    connection.rollback()
+            except (psycopg2.OperationalError, psycopg2.InterfaceError):
+                close = True
+        else:
+            close = True
+
+        with self._condition:
+            if close is False and self._closed is False:
+                self._idle.append(connection)
+                self._condition.notify()
+                return
+            self._open -= 1
+            self._condition.notify()
+
+        if connection.closed == 0:
+            connection.close()
+        return
+
+    def closeall(self) -> None:
+        """Close all idle connections, and refuse further checkouts"""
+        with self._condition:
+            self._closed = True
+            idle = self._idle
+            self._idle = list()
+            self._open -= len(idle)
+            self._condition.notify_all()
+        for connection in idle:
+            connection.close()
+            continue
+        return
@@ -5,8 +5,17 @@ Copyright Amatino Pty Ltd
 """
 from nozomi.ancillary.immutable import Immutable
 from nozomi.ancillary.database_credentials import DatabaseCredentials
-from typing import Type, TypeVar, Any, Optional, Dict
+from typing import Type, TypeVar, Any, Optional, Dict, Iterable, Iterator
 from nozomi.data.sql_conforming import AnySQLConforming
+from nozomi.data.prepared_statements import PreparedStatements
+from nozomi.data.prepared_statement import PreparedStatement
+from uuid import uuid4
+
+try:
+    from psycopg2.extras import execute_batch, execute_values
+except ImportError:
+    execute_batch = None
+    execute_values = None
 
 T = TypeVar('T', bound='Datastore')
 
@@ -14,6 +23,8 @@ T = TypeVar('T', bound='Datastore')
 class Datastore:
     """An abstraction of a persistent data storage layer"""
 
+    prepared_statement_capacity = 64
+
     def __init__(
         self,
         credentials: DatabaseCredentials,
@@ -44,6 +55,122 @@ class Datastore:
         """
         raise NotImplementedError
 
+    def execute_prepared(
+        self,
+        statement: PreparedStatement,
+        arguments: Optional[Dict[str, AnySQLConforming]] = None,
+        atomic: bool = False,
+        threadsafe: bool = False
+    ) -> Optional[Any]:
+        """
+        Execute a PreparedStatement with the supplied arguments, preparing
+        it on the current connection first if need be. Datastores that
+        retry executions on a fresh connection must override this method,
+        such that the retry prepares the statement on that connection.
+        """
+        self.prepare(statement)
+        return self.execute(
+            query=statement.execution,
+            arguments=statement.arguments_for(arguments or dict()),
+            atomic=atomic,
+            threadsafe=threadsafe
+        )
+
+    def prepare(self, statement: PreparedStatement) -> None:
+        """
+        Prepare a statement on the current connection, unless it has been
+        already, deallocating the least recently used prepared statement if
+        the connection's record is full
+        """
+        prepared = self.prepared_statements()
+        if prepared.contains(statement.name):
+            return
+        self.cursor.execute(statement.preparation)
+        evicted = prepared.add(statement.name)
+        if evicted is not None:
+            self.cursor.execute('deallocate ' + evicted)
+        return
+
+    def stream(
+        self,
+        query: str,
+        arguments: Optional[Dict[str, AnySQLConforming]] = None,
+        batch_size: int = 1000
+    ) -> Iterator[Any]:
+        """
+        Yield the first column of each row returned by a supplied SQL query,
+        fetching `batch_size` rows per round trip via a named server-side
+        cursor. The cursor lives inside the current transaction.
+        """
+        cursor = self.connection.cursor(name='nozomi_' + uuid4().hex)
+        cursor.itersize = batch_size
+        try:
+            cursor.execute(query, arguments)
+            for row in cursor:
+                yield row[0]
+        finally:
+            cursor.close()
+        return
+
+    def execute_many(
+        self,
+        query: str,
+        argument_list: Iterable[Dict[str, AnySQLConforming]],
+        page_size: int = 100,
+        atomic: bool = False
+    ) -> None:
+        """
+        Execute a supplied SQL query once for each set of supplied arguments,
+        sending up to `page_size` executions per round trip.
+        """
+        if not execute_batch:
+            raise NotImplementedError('Install Psycopg2')
+        execute_batch(self.cursor, query, argument_list, page_size=page_size)
+        if atomic is True:
+            self.commit()
+        return
+
+    def execute_values(
+        self,
+        query: str,
+        argument_list: Iterable[Any],
+        template: Optional[str] = None,
+        page_size: int = 100,
+        atomic: bool = False
+    ) -> None:
+        """
+        Execute a supplied SQL query containing a single `VALUES %s`
+        placeholder, expanding up to `page_size` argument tuples into each
+        statement.
+        """
+        if not execute_values:
+            raise NotImplementedError('Install Psycopg2')
+        execute_values(
+            self.cursor,
+            query,
+            argument_list,
+            template=template,
+            page_size=page_size
+        )
+        if atomic is True:
+            self.commit()
+        return
+
+    def copy_from(
+        self,
+        query: str,
+        stream: Any,
+        atomic: bool = False
+    ) -> None:
+        """
+        Execute a supplied `COPY ... FROM STDIN` SQL query, reading data from
+        a supplied file-like stream
+        """
+        self.cursor.copy_expert(query, stream)
+        if atomic is True:
+            self.commit()
+        return
+
     def close(self) -> None:
         self.cursor.close()
         self.connection.close()
@@ -61,6 +188,22 @@ class Datastore:
         """Roll back the current transaction"""
         self.cursor.execute('rollback')
 
+    def prepared_statements(self) -> PreparedStatements:
+        """
+        Return a record of the statements prepared on the current
+        connection. The record is discarded whenever the connection is
+        replaced, for example by `.refresh()`.
+        """
+        connection = self.connection
+        statements = getattr(self, '_prepared_statements', None)
+        if statements is None or statements.connection is not connection:
+            statements = PreparedStatements(
+                connection,
+                self.prepared_statement_capacity
+            )
+            self._prepared_statements = statements
+        return statements
+
     def start_transaction(self) -> None:
         """Start a database transaction"""
         self.cursor.execute('start transaction')
@@ -3,8 +3,9 @@ Nozomi
 Decodable Module
 author: hugh@blinkybeach.com
 """
-from json import loads
-from typing import Any, Optional, TypeVar, Type, List, Dict
+from json import loads, load
+from typing import Any, Optional, TypeVar, Type, List, Dict, Iterable
+from typing import Iterator, Union, IO
 from nozomi.http.content_type import ContentType
 from nozomi.data.xml import XML
 
@@ -29,12 +30,20 @@ class Decodable:
     @classmethod
     def deserialise(
         cls: Type[T],
-        serial: str,
+        serial: Union[str, bytes, IO],
         format: ContentType = ContentType.JSON
     ) -> T:
-        """Return a JSON string representation of the object"""
+        """
+        Return an object decoded from a serialised string, or from a
+        file-like object. XML read from a file-like object is parsed
+        incrementally.
+        """
+        if format == ContentType.JSON and hasattr(serial, 'read'):
+            return cls.decode(load(serial))
         if format == ContentType.JSON:
             return cls.decode(loads(serial))
+        if format == ContentType.XML and hasattr(serial, 'read'):
+            return cls.decode(XML.stream_to_data(serial))
         if format == ContentType.XML:
             return cls.decode(XML.xmlstring_to_data(serial))
         raise NotImplementedError('Format not implemented')
@@ -53,6 +62,13 @@ class Decodable:
         """Return list of decoded instances of an object"""
         return [cls.decode(d) for d in data]
 
+    @classmethod
+    def decode_stream(cls: Type[T], data: Iterable[Any]) -> Iterator[T]:
+        """Yield decoded instances of an object one at a time"""
+        for datum in data:
+            yield cls.decode(datum)
+        return
+
     @classmethod
     def optionally_decode_many(
         cls: Type[T],
@@ -3,15 +3,16 @@ Nozomi
 Encodable Module
 author: hugh@blinkybeach.com
 """
-from json import dumps
-from typing import Any, TypeVar, Type, List
+from typing import Any, TypeVar, Type, List, Iterable, Iterator, Optional
 from nozomi.http.content_type import ContentType
-from nozomi.data.encoder import Encoder
 from nozomi.data.abstract_encodable import AbstractEncodable
+from nozomi.data.json_serialiser import JSONSerialiser
 from nozomi.data.xml import XML
 
 T = TypeVar('T', bound='Encodable')
 
+_STANDARD = JSONSerialiser()
+
 
 class Encodable(AbstractEncodable):
     """Abstract protocol defining an interface for encodable classes"""
@@ -20,19 +21,17 @@ class Encodable(AbstractEncodable):
         """Return a JSON-serialisable form of the object"""
         raise NotImplementedError
 
-    def serialise(self, format: ContentType = ContentType.JSON) -> str:
+    def serialise(
+        self,
+        format: ContentType = ContentType.JSON,
+        serialiser: Optional[JSONSerialiser] = None
+    ) -> str:
         """
         Return a string encoded representation of the object in the
-        supplied format
+        supplied format. Optionally supply a JSONSerialiser backend.
         """
         if format == ContentType.JSON:
-            return dumps(
-                cls=Encoder,
-                obj=self,
-                separators=(',', ': '),
-                sort_keys=True,
-                indent=4
-            )
+            return (serialiser or _STANDARD).serialise(self)
         if format == ContentType.XML:
             return XML.data_to_xmlstring(self.encode())
 
@@ -48,24 +47,48 @@ class Encodable(AbstractEncodable):
     @classmethod
     def serialise_many(
         cls: Type[T],
-        data: List[T],
-        format: ContentType = ContentType.JSON
+        data: Iterable[T],
+        format: ContentType = ContentType.JSON,
+        serialiser: Optional[JSONSerialiser] = None
     ) -> str:
-        """Return json serialised list data"""
+        """
+        Return json serialised list data. Data may be any iterable, for
+        example a stream from `Decodable.decode_stream()`, in which case
+        objects are encoded one at a time.
+        """
+        serialiser = serialiser or _STANDARD
+
+        if format == ContentType.JSON and not isinstance(data, list):
+            return serialiser.serialise_iterable(data)
 
         if format == ContentType.JSON:
-            return dumps(
-                cls=Encoder,
-                obj=data,
-                separators=(',', ': '),
-                sort_keys=True,
-                indent=4
-            )
+            return serialiser.serialise(data)
 
         if format == ContentType.XML:
-            return XML.data_to_xmlstring([d.encode() for d in data])
-        
+            return ''.join(XML.stream_many(d.encode() for d in data))
+
         raise NotImplementedError(
             str(format.indexid) + ', ' + str(type(format))
         )
 
+    @classmethod
+    def stream_many(
+        cls: Type[T],
+        data: Iterable[T],
+        format: ContentType = ContentType.JSON,
+        serialiser: Optional[JSONSerialiser] = None
+    ) -> Iterator[str]:
+        """
+        Lazily yield pieces of serialised list data, encoding each object
+        only as the next piece is requested. Suitable for chunked transfer
+        of large responses.
+        """
+        if format == ContentType.JSON:
+            return (serialiser or _STANDARD).iterate_iterable(data)
+
+        if format == ContentType.XML:
+            return XML.stream_many(d.encode() for d in data)
+
+        raise NotImplementedError(
+            str(format.indexid) + ', ' + str(type(format))
+        )
@@ -15,12 +15,4 @@ class Encoder(JSONEncoder):
         if isinstance(object, AbstractEncodable):
             return object.encode()
 
-        if (
-                isinstance(object, list)
-                and False not in [
-                    isinstance(o, AbstractEncodable) for o in object
-                ]
-        ):
-            return [o.encode() for o in object]
-
         return super().default(object)
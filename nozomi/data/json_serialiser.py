@@ -0,0 +1,173 @@
+"""
+Nozomi
+JSON Serialiser Module
+Copyright Amatino Pty Ltd
+"""
+from io import StringIO
+from typing import Any, Iterable, Iterator, TypeVar, Type
+from nozomi.data.encoder import Encoder
+from nozomi.data.abstract_encodable import AbstractEncodable
+from nozomi.ancillary.immutable import Immutable
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+T = TypeVar('T', bound='JSONSerialiser')
+
+
+class JSONSerialiser:
+    """
+    A pluggable JSON serialisation backend. By default, output is indented
+    and key-sorted, via the standard library. Compact output is unindented
+    and unsorted, and may be produced by `orjson` or `ujson` if installed,
+    via the `orjson` or `ujson` extras.
+
+    The backend applies to compact output only. Indented output is always
+    produced by the standard library, such that it is identical whichever
+    backend is installed. Objects a backend cannot serialise natively are
+    handled as by the standard library encoder, with the exception that
+    `ujson` serialises Decimals as floats, where the standard library
+    raises TypeError.
+    """
+
+    STANDARD = 'standard'
+    ORJSON = 'orjson'
+    UJSON = 'ujson'
+    FASTEST = 'fastest'
+
+    _BACKENDS = (STANDARD, ORJSON, UJSON, FASTEST)
+
+    def __init__(
+        self,
+        backend: str = STANDARD,
+        compact: bool = False
+    ) -> None:
+
+        if backend not in self._BACKENDS:
+            raise ValueError('Unknown JSON backend: ' + str(backend))
+
+        if backend == self.FASTEST:
+            backend = self.STANDARD
+            if ujson:
+                backend = self.UJSON
+            if orjson:
+                backend = self.ORJSON
+
+        if backend == self.ORJSON and not orjson:
+            raise NotImplementedError('Install orjson')
+
+        if backend == self.UJSON and not ujson:
+            raise NotImplementedError('Install ujson')
+
+        self._backend = backend
+        self._compact = compact
+        self._encoder = Encoder(separators=(',', ':'))
+        if compact is False:
+            self._encoder = Encoder(
+                separators=(',', ': '),
+                sort_keys=True,
+                indent=4
+            )
+
+        return
+
+    backend: str = Immutable(lambda s: s._backend)
+    compact: bool = Immutable(lambda s: s._compact)
+
+    def serialise(self, data: Any) -> str:
+        """Return a JSON string representation of the supplied data"""
+
+        if self._compact is False:
+            return self._encoder.encode(data)
+
+        if self._backend == self.ORJSON:
+            return orjson.dumps(
+                self._pre_encode(data),
+                default=self._encoder.default,
+                option=(
+                    orjson.OPT_PASSTHROUGH_DATETIME
+                    | orjson.OPT_PASSTHROUGH_DATACLASS
+                    | orjson.OPT_NON_STR_KEYS
+                )
+            ).decode('utf-8')
+
+        if self._backend == self.UJSON:
+            return ujson.dumps(
+                self._pre_encode(data),
+                default=self._encoder.default,
+                ensure_ascii=False,
+                escape_forward_slashes=False
+            )
+
+        return self._encoder.encode(data)
+
+    def serialise_iterable(self, data: Iterable[Any]) -> str:
+        """
+        Return a JSON array representation of an arbitrary iterable,
+        serialising one element at a time, formatted identically to a
+        serialised list
+        """
+        output = StringIO()
+        self.write_iterable(data, output)
+        return output.getvalue()
+
+    def write_iterable(self, data: Iterable[Any], output: Any) -> None:
+        """
+        Write a JSON array representation of an arbitrary iterable to a
+        file-like output, in a single pass, without building any
+        intermediate list
+        """
+        for piece in self.iterate_iterable(data):
+            output.write(piece)
+        return
+
+    def iterate_iterable(self, data: Iterable[Any]) -> Iterator[str]:
+        """
+        Lazily yield pieces of a JSON array representation of an arbitrary
+        iterable, serialising each element only as it is requested. Joined,
+        the pieces are identical to the output of `.serialise_iterable()`.
+        """
+        opening, separator, closing = '[', ',', ']'
+        if self._compact is False:
+            opening, separator, closing = '[\n    ', ',\n    ', '\n]'
+
+        written = False
+        for element in data:
+            encoded = self.serialise(self._pre_encode(element))
+            if self._compact is False:
+                encoded = encoded.replace('\n', '\n    ')
+            yield (separator if written else opening) + encoded
+            written = True
+            continue
+
+        yield closing if written else '[]'
+        return
+
+    @staticmethod
+    def _pre_encode(data: Any) -> Any:
+        """
+        Encode top level Encodables up front, such that the backend need
+        only call back into Python for nested Encodables
+        """
+        if isinstance(data, AbstractEncodable):
+            return data.encode()
+        if isinstance(data, list):
+            return [
+                d.encode() if isinstance(d, AbstractEncodable) else d
+                for d in data
+            ]
+        return data
+
+    @classmethod
+    def from_configuration(cls: Type[T], configuration: Any) -> T:
+        return cls(
+            backend=configuration.json_backend,
+            compact=configuration.compact_json
+        )
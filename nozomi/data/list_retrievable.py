@@ -6,6 +6,7 @@ author: hugh@blinkybeach.com
 from nozomi.data.publicly_identified import PubliclyIdentified
 from typing import TypeVar, Type, Optional, List
 from nozomi import Datastore
+from nozomi.data.async_datastore import AsyncDatastore
 
 T = TypeVar('T', bound='ListRetrievable')
 
@@ -22,6 +23,16 @@ class ListRetrievable(PubliclyIdentified):
 
         raise NotImplementedError
 
+    @classmethod
+    async def retrieve_many_async(
+        cls: Type[T],
+        datastore: AsyncDatastore,
+        public_id: str,
+        in_transaction: bool = False
+    ) -> List[T]:
+
+        raise NotImplementedError
+
     # Override PubliclyIdentified.retrieve()
     @classmethod
     def retrieve(
@@ -41,3 +52,23 @@ class ListRetrievable(PubliclyIdentified):
             return None
 
         return result[0]
+
+    # Override PubliclyIdentified.retrieve_async()
+    @classmethod
+    async def retrieve_async(
+        cls: Type[T],
+        public_id: str,
+        datastore: AsyncDatastore,
+        in_transaction: bool = False
+    ) -> Optional[T]:
+
+        result = await cls.retrieve_many_async(
+            datastore=datastore,
+            public_id=public_id,
+            in_transaction=in_transaction
+        )
+
+        if result is None or len(result) < 1:
+            return None
+
+        return result[0]
@@ -0,0 +1,293 @@
+"""
+Nozomi
+Pooled Datastore Module
+Copyright Amatino Pty Ltd
+"""
+from nozomi.ancillary.immutable import Immutable
+from nozomi.ancillary.database_credentials import DatabaseCredentials
+from nozomi.data.datastore import Datastore
+from nozomi.data.sql_conforming import AnySQLConforming
+from nozomi.data.prepared_statements import PreparedStatements
+from nozomi.data.prepared_statement import PreparedStatement
+from typing import Type, TypeVar, Any, Optional, Dict, Iterator, Callable
+from contextlib import contextmanager
+import threading
+import weakref
+
+from nozomi.data.database_connection_pool import DatabaseConnectionPool
+
+try:
+    import psycopg2
+    from psycopg2.extensions import TRANSACTION_STATUS_UNKNOWN
+except ImportError:
+    psycopg2 = None
+    TRANSACTION_STATUS_UNKNOWN = None
+
+T = TypeVar('T', bound='PooledDatastore')
+
+
+class _Hold:
+    """
+    A connection and cursor held by a thread. When the thread exits, its
+    hold is collected and the connection returned to the pool.
+    """
+    __slots__ = ('pair', 'finalizer', '__weakref__')
+
+    def __init__(self, pool: DatabaseConnectionPool, pair: Any) -> None:
+        self.pair = pair
+        self.finalizer = weakref.finalize(self, _return, pool, *pair)
+        return
+
+
+def _return(
+    pool: DatabaseConnectionPool,
+    connection: Any,
+    cursor: Any
+) -> None:
+    try:
+        cursor.close()
+    except Exception:
+        pass
+    pool.putconn(connection)
+    return
+
+
+class PooledDatastore(Datastore):
+    """
+    A Datastore backed by a thread-safe pool of psycopg2 connections. Each
+    thread checks out its own connection, so a threaded worker may execute
+    many queries at once without opening a connection per request.
+
+    By default a thread holds its connection until it calls `.release()`,
+    or exits. For per-request checkout, wrap request handling in
+    `.checkout()`. Returned connections are kept open for reuse, up to
+    `maximum_connections`. Once that many are checked out, further
+    checkouts wait up to `checkout_timeout` seconds.
+    """
+
+    def __init__(
+        self,
+        credentials: DatabaseCredentials,
+        debug: bool = False,
+        minimum_connections: int = 1,
+        maximum_connections: int = 8,
+        health_check: bool = True,
+        checkout_timeout: float = 30
+    ) -> None:
+
+        if not psycopg2:
+            raise NotImplementedError('Install Psycopg2')
+
+        assert isinstance(credentials, DatabaseCredentials)
+        assert isinstance(minimum_connections, int)
+        assert isinstance(maximum_connections, int)
+        assert 0 <= minimum_connections <= maximum_connections
+
+        self._credentials = credentials
+        self._debug = debug
+        self._minimum_connections = minimum_connections
+        self._maximum_connections = maximum_connections
+        self._health_check = health_check
+        self._checkout_timeout = checkout_timeout
+        self._local = threading.local()
+        self._statements: weakref.WeakKeyDictionary = (
+            weakref.WeakKeyDictionary()
+        )
+        self._pool = self._create_pool()
+
+        return
+
+    connection = Immutable(lambda s: s._checkout()[0])
+    cursor = Immutable(lambda s: s._checkout()[1])
+    debug = Immutable(lambda s: s._debug)
+
+    def _create_pool(self) -> DatabaseConnectionPool:
+        return DatabaseConnectionPool(
+            self._credentials.dsn_string,
+            self._minimum_connections,
+            self._maximum_connections,
+            timeout=self._checkout_timeout
+        )
+
+    def _checkout(self) -> Any:
+        """
+        Return a (connection, cursor) tuple held by the calling thread,
+        checking a connection out of the pool if the thread holds none
+        """
+        held = getattr(self._local, 'held', None)
+        if held is not None:
+            return held.pair
+
+        attempts = self._maximum_connections + 1
+        while attempts > 0:
+            attempts -= 1
+            connection = self._pool.getconn()
+            if self._is_healthy(connection):
+                held = _Hold(self._pool, (connection, connection.cursor()))
+                self._local.held = held
+                return held.pair
+            self._statements.pop(connection, None)
+            self._pool.putconn(connection, close=True)
+            continue
+
+        raise RuntimeError('Unable to check out a healthy database connection')
+
+    def _is_healthy(self, connection: Any) -> bool:
+        """Return True if a pooled connection appears usable"""
+        if connection.closed != 0:
+            return False
+        if connection.get_transaction_status() == TRANSACTION_STATUS_UNKNOWN:
+            return False
+        if self._health_check is False:
+            return True
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute('select 1')
+            connection.rollback()
+        except (psycopg2.OperationalError, psycopg2.InterfaceError):
+            return False
+        return True
+
+    def release(self, discard: bool = False) -> None:
+        """
+        Return the calling thread's connection, if any, to the pool.
+        Uncommitted work is rolled back. Optionally discard the connection
+        rather than returning it for reuse.
+        """
+        held = getattr(self._local, 'held', None)
+        if held is None:
+            return
+        self._local.held = None
+        held.finalizer.detach()
+        connection, cursor = held.pair
+        try:
+            cursor.close()
+        except (psycopg2.OperationalError, psycopg2.InterfaceError):
+            discard = True
+        discard = discard or connection.closed != 0
+        if discard is True:
+            self._statements.pop(connection, None)
+        self._pool.putconn(connection, close=discard)
+        return
+
+    def prepared_statements(self) -> PreparedStatements:
+        """
+        Return a record of the statements prepared on the calling thread's
+        connection
+        """
+        connection = self.connection
+        statements = self._statements.get(connection)
+        if statements is None:
+            statements = PreparedStatements(
+                connection,
+                self.prepared_statement_capacity
+            )
+            self._statements[connection] = statements
+        return statements
+
+    @contextmanager
+    def checkout(self) -> Iterator[T]:
+        """
+        Hold a pooled connection for the duration of a `with` block, for
+        example the lifetime of a single request
+        """
+        try:
+            yield self
+        finally:
+            self.release()
+
+    def refresh(self) -> None:
+        """
+        Discard the calling thread's connection and check out a fresh one
+        """
+        self.release(discard=True)
+        self._checkout()
+        return
+
+    def execute(
+        self,
+        query: str,
+        arguments: Optional[Dict[str, AnySQLConforming]] = None,
+        atomic: bool = False,
+        threadsafe: bool = False
+    ) -> Optional[Any]:
+        """
+        Execute a supplied SQL query string with the supplied arguments,
+        returning the first column of the first row, if any. Connections are
+        held per-thread, so all executions are threadsafe. Atomic queries
+        are committed immediately, and are retried once on a fresh
+        connection if the connection breaks in flight.
+        """
+        return self._retrying(
+            lambda: self._execute(query, arguments, atomic),
+            atomic
+        )
+
+    def execute_prepared(
+        self,
+        statement: PreparedStatement,
+        arguments: Optional[Dict[str, AnySQLConforming]] = None,
+        atomic: bool = False,
+        threadsafe: bool = False
+    ) -> Optional[Any]:
+        """
+        Execute a PreparedStatement, preparing it on the calling thread's
+        connection first if need be. Atomic executions are retried once on
+        a fresh connection, on which the statement is prepared anew.
+        """
+        arguments = statement.arguments_for(arguments or dict())
+
+        def execute() -> Optional[Any]:
+            self.prepare(statement)
+            return self._execute(statement.execution, arguments, atomic)
+
+        return self._retrying(execute, atomic)
+
+    def _retrying(
+        self,
+        execute: Callable[[], Optional[Any]],
+        atomic: bool
+    ) -> Optional[Any]:
+
+        try:
+            return execute()
+        except (psycopg2.OperationalError, psycopg2.InterfaceError):
+            if atomic is False:
+                self.release(discard=True)
+                raise
+            self.refresh()
+
+        return execute()
+
+    def _execute(
+        self,
+        query: str,
+        arguments: Optional[Dict[str, AnySQLConforming]],
+        atomic: bool
+    ) -> Optional[Any]:
+
+        connection, cursor = self._checkout()
+        cursor.execute(query, arguments)
+        result = cursor.fetchone() if cursor.description is not None else None
+        if atomic is True:
+            connection.commit()
+        if result is None:
+            return None
+        return result[0]
+
+    def close(self) -> None:
+        """Close every connection in the pool"""
+        self._local = threading.local()
+        self._statements = weakref.WeakKeyDictionary()
+        self._pool.closeall()
+        return
+
+    @classmethod
+    def from_config(cls: Type[T], configuration: Any) -> T:
+        return cls(
+            configuration.database_credentials,
+            configuration.debug,
+            minimum_connections=configuration.database_minimum_connections,
+            maximum_connections=configuration.database_maximum_connections,
+            checkout_timeout=configuration.database_checkout_timeout
+        )
@@ -0,0 +1,58 @@
+"""
+Nozomi
+Prepared Statement Module
+Copyright Amatino Pty Ltd
+"""
+from nozomi.ancillary.immutable import Immutable
+from typing import Dict, Any, List
+from hashlib import sha256
+import re
+
+_PLACEHOLDER = re.compile(r'%\((\w+)\)s|%%')
+
+
+class PreparedStatement:
+    """
+    A server-side prepared form of an SQL query written with `%(name)s`
+    argument placeholders. Named arguments are rewritten as positional
+    parameters, and supplied at execution time via `EXECUTE`.
+    """
+
+    def __init__(self, query: str) -> None:
+
+        assert isinstance(query, str)
+
+        self._name = 'nozomi_' + sha256(query.encode('utf-8')).hexdigest()[:32]
+        self._argument_names: List[str] = list()
+
+        def substitute(match: Any) -> str:
+            name = match.group(1)
+            if name is None:
+                return '%'
+            if name not in self._argument_names:
+                self._argument_names.append(name)
+            return '$' + str(self._argument_names.index(name) + 1)
+
+        body = _PLACEHOLDER.sub(substitute, query).strip().rstrip(';')
+
+        self._preparation = 'prepare ' + self._name + ' as ' + body
+
+        self._execution = 'execute ' + self._name
+        if len(self._argument_names) > 0:
+            self._execution += '(' + ', '.join(
+                ['%(' + n + ')s' for n in self._argument_names]
+            ) + ')'
+
+        return
+
+    name: str = Immutable(lambda s: s._name)
+    preparation: str = Immutable(lambda s: s._preparation)
+    execution: str = Immutable(lambda s: s._execution)
+    deallocation: str = Immutable(lambda s: 'deallocate ' + s._name)
+
+    def arguments_for(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Return the subset of supplied arguments used by this statement"""
+        try:
+            return {n: arguments[n] for n in self._argument_names}
+        except KeyError as error:
+            raise KeyError('Missing query argument: ' + str(error.args[0]))
@@ -0,0 +1,58 @@
+"""
+Nozomi
+Prepared Statements Module
+Copyright Amatino Pty Ltd
+"""
+from nozomi.ancillary.immutable import Immutable
+from collections import OrderedDict
+from typing import Any, Optional
+import weakref
+
+
+class PreparedStatements:
+    """
+    A least-recently-used record of the statements prepared on a single
+    database connection. Discard it whenever the connection is replaced.
+    The record refers to its connection weakly, such that it may be held
+    in a mapping keyed by connection.
+    """
+
+    def __init__(self, connection: Any, capacity: int = 64) -> None:
+
+        assert isinstance(capacity, int)
+        assert capacity > 0
+
+        self._connection = weakref.ref(connection)
+        self._capacity = capacity
+        self._names: OrderedDict = OrderedDict()
+
+        return
+
+    connection = Immutable(lambda s: s._connection())
+    capacity: int = Immutable(lambda s: s._capacity)
+
+    def contains(self, name: str) -> bool:
+        """
+        Return True if the named statement has been prepared, marking it as
+        recently used
+        """
+        if name not in self._names:
+            return False
+        self._names.move_to_end(name)
+        return True
+
+    def add(self, name: str) -> Optional[str]:
+        """
+        Record a newly prepared statement, returning the name of a statement
+        evicted to make room, if any. The caller is responsible for
+        deallocating evicted statements.
+        """
+        self._names[name] = None
+        self._names.move_to_end(name)
+        if len(self._names) <= self._capacity:
+            return None
+        evicted, _ = self._names.popitem(last=False)
+        return evicted
+
+    def __len__(self) -> int:
+        return len(self._names)
@@ -6,6 +6,7 @@ author: hugh@blinkybeach.com
 from nozomi.errors.not_found import NotFound
 from nozomi.data.decodable import Decodable
 from nozomi.data.datastore import Datastore
+from nozomi.data.async_datastore import AsyncDatastore
 from nozomi.data.query import Query
 from nozomi.data.named import Named
 from typing import Type, TypeVar, Optional
@@ -54,6 +55,24 @@ class PubliclyIdentified(Decodable, Named):
 
         return Self.optionally_decode(result)
 
+    @classmethod
+    async def retrieve_async(
+        Self: Type[Self],
+        public_id: str,
+        datastore: AsyncDatastore,
+        in_transaction: bool = False
+    ) -> Optional[Self]:
+
+        result = await Self.Q_RETRIEVE.execute_async(
+            datastore=datastore,
+            arguments={
+                'public_id': public_id
+            },
+            atomic=(not in_transaction)
+        )
+
+        return Self.optionally_decode(result)
+
     @classmethod
     def retrieve_assertively(
         Self: Type[Self],
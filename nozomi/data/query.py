@@ -3,24 +3,36 @@ Nozomi
 Query Module
 Copyright Amatino Pty Ltd
 """
-from typing import Type, TypeVar, Dict, Optional, Union
+from typing import Type, TypeVar, Dict, Optional, Union, Iterable, List
+from typing import Iterator, Any
 from collections.abc import Sequence, Mapping
 from nozomi.data.datastore import Datastore
+from nozomi.data.async_datastore import AsyncDatastore
 from nozomi.data.sql_conforming import AnySQLConforming
+from nozomi.data.prepared_statement import PreparedStatement
+from nozomi.data.copy_stream import CopyStream, Row
 
 T = TypeVar('T', bound='Query')
 
 
 class Query:
-    """An SQL query"""
+    """
+    An SQL query. Optionally, a Query may be prepared server-side, once per
+    connection, so that subsequent executions skip parsing and planning.
+    Only single-statement queries may be prepared.
+    """
 
     def __init__(
         self,
         query: str,
+        prepare: bool = False
     ) -> None:
 
         assert isinstance(query, str)
+        assert isinstance(prepare, bool)
         self._query = query
+        self._prepare = prepare
+        self._statements: Dict[str, PreparedStatement] = dict()
 
         return
 
@@ -33,14 +45,19 @@ class Query:
         threadsafe: bool = False,
         mogrify: bool = False
     ) -> Optional[Union[Sequence, Mapping]]:
-        query = self._query
-        if dynamic_arguments is not None:
-            query = self._query.format(**dynamic_arguments)
+        query = self._compile(dynamic_arguments)
         if mogrify is True:
             print(datastore.mogrify(
                 query=query,
                 arguments=arguments
             ))
+        if self._prepare is True:
+            return datastore.execute_prepared(
+                statement=self._statement_for(query),
+                arguments=arguments,
+                atomic=atomic,
+                threadsafe=threadsafe
+            )
         return datastore.execute(
             query=query,
             arguments=arguments,
@@ -48,32 +65,146 @@ class Query:
             threadsafe=threadsafe
         )
 
+    def stream(
+        self,
+        datastore: Datastore,
+        arguments: Optional[Dict[str, AnySQLConforming]] = None,
+        batch_size: int = 1000,
+        dynamic_arguments: Optional[Dict[str, str]] = None
+    ) -> Iterator[Any]:
+        """
+        Yield results one row at a time, holding at most `batch_size` rows
+        in memory. Streamed queries should return one object per row.
+        """
+        return datastore.stream(
+            query=self._compile(dynamic_arguments),
+            arguments=arguments,
+            batch_size=batch_size
+        )
+
+    def execute_many(
+        self,
+        datastore: Datastore,
+        argument_list: Iterable[Dict[str, AnySQLConforming]],
+        dynamic_arguments: Optional[Dict[str, str]] = None,
+        page_size: int = 100,
+        atomic: bool = False
+    ) -> None:
+        """
+        Execute this query once for each set of supplied arguments, batching
+        up to `page_size` executions into each round trip to the database
+        """
+        query = self._compile(dynamic_arguments)
+        if self._prepare is True:
+            statement = self._statement_for(query)
+            datastore.prepare(statement)
+            query = statement.execution
+            argument_list = (
+                statement.arguments_for(a) for a in argument_list
+            )
+        return datastore.execute_many(
+            query=query,
+            argument_list=argument_list,
+            page_size=page_size,
+            atomic=atomic
+        )
+
+    def execute_values(
+        self,
+        datastore: Datastore,
+        argument_list: Iterable[Any],
+        template: Optional[str] = None,
+        dynamic_arguments: Optional[Dict[str, str]] = None,
+        page_size: int = 100,
+        atomic: bool = False
+    ) -> None:
+        """
+        Execute this query, which must contain a single `VALUES %s`
+        placeholder, expanding up to `page_size` argument tuples into each
+        round trip to the database. For example, a batched
+        `UPDATE ... FROM (VALUES %s)`. Such queries are never prepared.
+        """
+        return datastore.execute_values(
+            query=self._compile(dynamic_arguments),
+            argument_list=argument_list,
+            template=template,
+            page_size=page_size,
+            atomic=atomic
+        )
+
+    def copy_from(
+        self,
+        datastore: Datastore,
+        rows: Iterable[Row],
+        columns: List[str],
+        dynamic_arguments: Optional[Dict[str, str]] = None,
+        atomic: bool = False
+    ) -> None:
+        """
+        Stream rows into the database via this query, which must be a
+        `COPY ... FROM STDIN` statement naming the supplied columns in order.
+        Rows may be mappings keyed by column name, or sequences ordered as
+        `columns`.
+        """
+        return datastore.copy_from(
+            query=self._compile(dynamic_arguments),
+            stream=CopyStream(rows=rows, columns=columns),
+            atomic=atomic
+        )
+
+    async def execute_async(
+        self,
+        datastore: AsyncDatastore,
+        arguments: Optional[Dict[str, AnySQLConforming]] = None,
+        dynamic_arguments: Optional[Dict[str, str]] = None,
+        atomic: bool = False
+    ) -> Optional[Union[Sequence, Mapping]]:
+        return await datastore.execute(
+            query=self._compile(dynamic_arguments),
+            arguments=arguments,
+            atomic=atomic
+        )
+
+    def _compile(self, dynamic_arguments: Optional[Dict[str, str]]) -> str:
+        """Return query text with any dynamic arguments substituted"""
+        if dynamic_arguments is None:
+            return self._query
+        return self._query.format(**dynamic_arguments)
+
+    def _statement_for(self, query: str) -> PreparedStatement:
+        """Return a PreparedStatement for the supplied compiled query"""
+        statement = self._statements.get(query)
+        if statement is None:
+            statement = PreparedStatement(query)
+            self._statements[query] = statement
+        return statement
+
     def mogrify(
         self,
         datastore: Datastore,
         arguments: Optional[Dict[str, AnySQLConforming]] = None,
         dynamic_arguments: Optional[Dict[str, str]] = None
     ) -> str:
-        query = self._query
-        if dynamic_arguments is not None:
-            query = self._query.format(**dynamic_arguments)
+        query = self._compile(dynamic_arguments)
         return datastore.mogrify(query, arguments)
 
     @classmethod
     def from_file(
         cls: Type[T],
-        filename: str
+        filename: str,
+        prepare: bool = False
     ) -> T:
 
         with open(filename) as qfile:
             query = qfile.read()
 
-        return cls(query=query)
+        return cls(query=query, prepare=prepare)
 
     @classmethod
     def optionally_from_file(
         cls: Type[T],
-        filename: str
+        filename: str,
+        prepare: bool = False
     ) -> Optional[T]:
 
         try:
@@ -82,7 +213,7 @@ class Query:
         except FileNotFoundError:
             return None
 
-        return cls(query=query)
+        return cls(query=query, prepare=prepare)
 
     @classmethod
     def require(
@@ -55,6 +55,24 @@ class SQLConforming(ISQLQuote):
             self._QUOTE_LENGTH
         ).dash_free_urlsafe_base64.replace('=', '') + '$'
 
+    def copy_text(self) -> str:
+        """
+        Return a form of this object suitable for the text format of the
+        SQL COPY command. By default, this is derived by unquoting
+        `.sql_representation`.
+        """
+        literal = self.getquoted()
+        if isinstance(literal, bytes):
+            literal = literal.decode('utf-8')
+        if literal.startswith("E'") and literal.endswith("'"):
+            return literal[2:-1].replace("''", "'").replace('\\\\', '\\')
+        if literal.startswith("'") and literal.endswith("'"):
+            return literal[1:-1].replace("''", "'")
+        if literal.startswith('$'):
+            tag = literal[:literal.index('$', 1) + 1]
+            return literal[len(tag):-len(tag)]
+        return literal
+
     def adapt_bool(self, boolean_data: bool) -> bytes:
         assert isinstance(boolean_data, bool)
         if boolean_data is True:
@@ -3,117 +3,267 @@ Nozomi
 XML Module
 author: hugh@blinkybeach.com
 """
-from typing import Dict, Any
-from xml.etree import cElementTree as unsafeElementTree
-from collections import defaultdict
-from xml.dom import minidom
+from typing import Dict, Any, Iterable, Iterator, Optional, Callable, List
+from typing import Tuple, Union, IO
 
 try:
-    from defusedxml import cElementTree
+    from defusedxml.ElementTree import DefusedXMLParser
 except ImportError:
-    cElementTree = None
+    DefusedXMLParser = None
 
 
 class XML:
 
     wrapper_key = 'payload'
 
+    _DECLARATION = '<?xml version="1.0" ?>'
+
     @staticmethod
-    def xmlstring_to_data(string: str) -> Any:
+    def xmlstring_to_data(string: Union[str, bytes]) -> Any:
+        """
+        Return data decoded from a complete XML document. Entity
+        declarations and external references are rejected.
+        """
+        parser = XML._create_parser()
+        parser.feed(string)
+        return XML._unwrap(parser.close())
 
-        if not cElementTree:
+    @staticmethod
+    def stream_to_data(source: IO, chunk_size: int = 65536) -> Any:
+        """
+        Return data decoded from an XML document read incrementally from a
+        file-like source. No element tree is built, such that memory use is
+        bounded by the size of the decoded data. Entity declarations and
+        external references are rejected.
+        """
+        parser = XML._create_parser()
+        while True:
+            chunk = source.read(chunk_size)
+            if not chunk:
+                break
+            parser.feed(chunk)
+            continue
+        return XML._unwrap(parser.close())
+
+    @staticmethod
+    def _create_parser() -> Any:
+
+        if not DefusedXMLParser:
             raise NotImplementedError('Install defusedxml')
 
-        element_tree = cElementTree.fromstring(string)
-        output = XML._etree_to_dict(tree=element_tree)
+        return DefusedXMLParser(
+            target=_DataBuilder(),
+            forbid_dtd=False,
+            forbid_entities=True,
+            forbid_external=True
+        )
+
+    @staticmethod
+    def _unwrap(output: Dict[str, Any]) -> Any:
         return output[XML.wrapper_key]
 
     @staticmethod
-    def data_to_xmlstring(data: Any) -> str:
-
-        data = {XML.wrapper_key: data}
-
-        def _to_etree(d, root):
-            if not d:
-                pass
-            elif isinstance(d, int):
-                root.text = str(d)
-            elif isinstance(d, str):
-                root.text = d
-            elif isinstance(d, dict):
-                for k, v in d.items():
-                    assert isinstance(k, str)
-                    if k.startswith('#'):
-                        assert k == '#text' and isinstance(v, str)
-                        root.text = v
-                    elif k.startswith('@'):
-                        assert isinstance(v, str)
-                        root.set(k[1:], v)
-                    elif isinstance(v, list):
-                        for e in v:
-                            _to_etree(e, unsafeElementTree.SubElement(root, k))
-                    else:
-                        _to_etree(v, unsafeElementTree.SubElement(root, k))
-            elif isinstance(d, list):
-                for item in d:
-                    _to_etree(
-                        item,
-                        unsafeElementTree.SubElement(root, XML.wrapper_key)
-                    )
-            else:
-                raise TypeError('invalid type: ' + str(type(d)))
+    def data_to_xmlstring(data: Any, indent: Optional[str] = '    ') -> str:
+        """
+        Return an XML document wrapping the supplied data, indenting nested
+        elements with the supplied string. Supply `indent=None` for output
+        without any whitespace between elements.
+        """
+        newline = '' if indent is None else '\n'
+        pieces = [XML._DECLARATION + newline]
+        XML._write(
+            data,
+            XML.wrapper_key,
+            pieces.append,
+            '',
+            indent or '',
+            newline
+        )
+        return ''.join(pieces)
 
-        assert isinstance(data, dict) and len(data) == 1
-        tag, body = next(iter(data.items()))
-        node = unsafeElementTree.Element(tag)
+    @staticmethod
+    def stream_many(
+        data: Iterable[Any],
+        indent: Optional[str] = '    '
+    ) -> Iterator[str]:
+        """
+        Lazily yield pieces of an XML document wrapping each element of the
+        supplied iterable, writing each element only as it is requested.
+        Joined, the pieces are identical to the output of
+        `.data_to_xmlstring()` for an equivalent list.
+        """
+        newline = '' if indent is None else '\n'
+        indent = indent or ''
+        opening = XML._DECLARATION + newline + '<' + XML.wrapper_key + '>'
+
+        written = False
+        for element in data:
+            pieces = [] if written else [opening + newline]
+            XML._write(
+                element,
+                XML.wrapper_key,
+                pieces.append,
+                indent,
+                indent,
+                newline
+            )
+            yield ''.join(pieces)
+            written = True
+            continue
 
-        _to_etree(body, node)
+        if written is False:
+            yield XML._DECLARATION + newline + '<' + XML.wrapper_key + '/>'
+            yield newline
+            return
 
-        return minidom.parseString(
-            unsafeElementTree.tostring(node).decode('utf-8')
-        ).toprettyxml(indent="    ")
+        yield '</' + XML.wrapper_key + '>' + newline
+        return
 
     @staticmethod
-    def _etree_to_dict(tree: cElementTree) -> Dict[str, Any]:
+    def _write(
+        d: Any,
+        tag: str,
+        write: Callable[[str], Any],
+        current_indent: str,
+        indent: str,
+        newline: str
+    ) -> None:
+        """
+        Write an element named `tag` representing the supplied data, in a
+        single pass, via the supplied `write` function
+        """
+        attributes: List[Tuple[str, str]] = list()
+        children: List[Tuple[str, Any]] = list()
+        text: Optional[str] = None
 
-        if not cElementTree:
-            raise NotImplementedError('Install defusedxml')
+        if not d:
+            pass
+        elif isinstance(d, int):
+            text = str(d)
+        elif isinstance(d, str):
+            text = d
+        elif isinstance(d, dict):
+            for k, v in d.items():
+                assert isinstance(k, str)
+                if k.startswith('#'):
+                    assert k == '#text' and isinstance(v, str)
+                    text = v
+                elif k.startswith('@'):
+                    assert isinstance(v, str)
+                    attributes.append((k[1:], v))
+                elif isinstance(v, list):
+                    children.extend((k, e) for e in v)
+                else:
+                    children.append((k, v))
+        elif isinstance(d, list):
+            children = [(XML.wrapper_key, item) for item in d]
+        else:
+            raise TypeError('invalid type: ' + str(type(d)))
+
+        write(current_indent + '<' + tag)
+        for name, value in attributes:
+            write(' ' + name + '="' + XML._escape(value) + '"')
 
-        t = tree
-
-        tag = t.tag.split('}')[-1] if len(t.tag.split('}')) > 1 else t.tag
-        d: Dict = {tag: {} if t.attrib else None}
-        children = list(t)
-        if children:
-            dd = defaultdict(list)
-            for dc in map(XML._etree_to_dict, children):
-                for k, v in dc.items():
-                    dd[k].append(v)
-            d = {tag: {k: v[0] if len(v) == 1 else v for k, v in dd.items()}}
-        if t.attrib:
-            d[tag].update(('@' + k, v) for k, v in t.attrib.items())
-        if t.text:
-            text = t.text.strip()
-            if children or t.attrib:
+        if not children:
+            if not text:
+                write('/>' + newline)
+                return
+            write('>' + XML._escape(text) + '</' + tag + '>' + newline)
+            return
+
+        write('>' + newline)
+        child_indent = current_indent + indent
+        if text:
+            write(child_indent + XML._escape(text) + newline)
+        for child_tag, child in children:
+            XML._write(child, child_tag, write, child_indent, indent, newline)
+            continue
+        write(current_indent + '</' + tag + '>' + newline)
+        return
+
+    @staticmethod
+    def _escape(text: str) -> str:
+        return text.replace('&', '&amp;').replace('<', '&lt;').replace(
+            '"', '&quot;'
+        ).replace('>', '&gt;')
+
+
+class _DataBuilder:
+    """
+    Parser target building decoded data in a single pass over the events
+    of an XML document, without constructing any intermediate tree.
+    Repeated child elements become lists, attributes are keyed with a '@'
+    prefix, and text accompanying children or attributes is keyed '#text'.
+    """
+
+    def __init__(self) -> None:
+        self._stack: List[List[Any]] = list()
+        self._output: Optional[Dict[str, Any]] = None
+        return
+
+    def start(self, tag: str, attributes: Dict[str, str]) -> None:
+        if self._stack:
+            self._stack[-1][3] = True
+        tag = tag.split('}')[-1]
+        self._stack.append([tag, attributes, None, False, list()])
+        return
+
+    def data(self, text: str) -> None:
+        frame = self._stack[-1]
+        if frame[3] is False:
+            frame[4].append(text)
+        return
+
+    def end(self, _) -> None:
+
+        tag, attributes, children, _, text = self._stack.pop()
+
+        value: Any = None
+        if children is not None:
+            value = children
+        elif attributes:
+            value = dict()
+
+        if attributes:
+            value.update(('@' + k, v) for k, v in attributes.items())
+
+        if text:
+            text = ''.join(text).strip()
+            if children is not None or attributes:
                 if text:
-                    d[tag]['#text'] = text
+                    value['#text'] = text
             else:
-                d[tag] = text
-
-        for k in d.keys():
-            v = d[k]
-            if not isinstance(v, str):
-                continue
-            if v == 'True':
-                d[k] = True
-            if v == 'False':
-                d[k] = False
-            if v.isdigit():
-                d[k] = int(v)
-                continue
-            if v.replace('.', '').isdigit():
-                d[k] = float(v)
-                continue
-            continue
+                value = self._coerce(text)
+
+        if not self._stack:
+            self._output = {tag: value}
+            return
+
+        parent = self._stack[-1]
+        if parent[2] is None:
+            parent[2] = dict()
+        siblings = parent[2]
 
-        return d
+        if tag not in siblings:
+            siblings[tag] = value
+        elif isinstance(siblings[tag], list):
+            siblings[tag].append(value)
+        else:
+            siblings[tag] = [siblings[tag], value]
+
+        return
+
+    def close(self) -> Dict[str, Any]:
+        return self._output
+
+    @staticmethod
+    def _coerce(value: str) -> Any:
+        if value == 'True':
+            return True
+        if value == 'False':
+            return False
+        if value.isdigit():
+            return int(value)
+        if value.replace('.', '').isdigit():
+            return float(value)
+        return value
@@ -15,6 +15,22 @@ import traceback
 
 
 class NozomiError(Exception):
+    """
+    An error that may be communicated to an API client. The policy under
+    which stack traces are formatted may be configured by assigning
+    `NozomiError.trace_policy`:
+
+    - `LAZY_TRACE`: Format on first read of `.stack_trace` (default)
+    - `EAGER_TRACE`: Format when the error is initialised
+    - `SERVER_ERROR_TRACE`: Format 500-class errors when initialised,
+        and omit stack traces from all other errors and their reports
+    """
+
+    LAZY_TRACE = 'lazy'
+    EAGER_TRACE = 'eager'
+    SERVER_ERROR_TRACE = 'server_errors'
+
+    trace_policy: str = LAZY_TRACE
 
     def __init__(
         self,
@@ -47,20 +63,15 @@ class NozomiError(Exception):
         self._original_error = original_error
         self._technical_description = technical_description
 
-        tb_target = original_error or self
+        self._trace_target = original_error or self
+        self._trace = self._trace_target.__traceback__
+        self._stack_trace: Optional[str] = None
 
-        if sys.version_info < (3, 10):
-            self._stack_trace = ''.join(traceback.format_exception(
-                etype=type(tb_target),
-                value=tb_target,
-                tb=tb_target.__traceback__
-            ))
-        else:
-            self._stack_trace = ''.join(traceback.format_exception(
-                tb_target,
-                value=tb_target,
-                tb=tb_target.__traceback__
-            ))
+        if self.trace_policy == self.EAGER_TRACE or (
+            self.trace_policy == self.SERVER_ERROR_TRACE
+            and self.is_500_class
+        ):
+            self._stack_trace = self._format_stack_trace()
 
         super().__init__(client_description)
         return
@@ -68,10 +79,44 @@ class NozomiError(Exception):
     http_status_code = Immutable(lambda s: s._http_code)
     client_description = Immutable(lambda s: s._client_description)
     technical_description = Immutable(lambda s: s._technical_description)
-    stack_trace = Immutable(lambda s: s._stack_trace)
+    stack_trace = Immutable(lambda s: s._read_stack_trace())
     info_package = Immutable(lambda s: s._info_package())
     is_500_class = Immutable(lambda s: str(s._http_code.value)[0] == '5')
 
+    def _traces_omitted(self) -> bool:
+        return (
+            self.trace_policy == self.SERVER_ERROR_TRACE
+            and not self.is_500_class
+        )
+
+    def _read_stack_trace(self) -> str:
+        if self._stack_trace is not None:
+            return self._stack_trace
+        if self._traces_omitted():
+            return ''
+        self._stack_trace = self._format_stack_trace()
+        return self._stack_trace
+
+    def _format_stack_trace(self) -> str:
+        """
+        Return a formatted stack trace as at the time this error was
+        initialised
+        """
+        tb_target = self._trace_target
+
+        if sys.version_info < (3, 10):
+            return ''.join(traceback.format_exception(
+                etype=type(tb_target),
+                value=tb_target,
+                tb=self._trace
+            ))
+
+        return ''.join(traceback.format_exception(
+            tb_target,
+            value=tb_target,
+            tb=self._trace
+        ))
+
     def _info_package(self) -> Dict[str, Any]:
         """
         Return a package of information an application can parse to
@@ -109,12 +154,13 @@ class NozomiError(Exception):
         if self._original_error:
             report += '\nOriginal exception:\n'
             report += str(self._original_error) + '\n'
-        report += '--//-- Begin traceback --//--\n\n'
-        trace = traceback.format_tb(self.__traceback__)
-        for line in trace:
-            report += line
-        report += '\n--//-- End traceback   --//--\n'
-        if self._original_error:
+        if not self._traces_omitted():
+            report += '--//-- Begin traceback --//--\n\n'
+            trace = traceback.format_tb(self.__traceback__)
+            for line in trace:
+                report += line
+            report += '\n--//-- End traceback   --//--\n'
+        if self._original_error and not self._traces_omitted():
             report += '\n--//-- Begin original exception traceback --//--'
             trace = traceback.format_tb(self._original_error.__traceback__)
             for line in trace:
@@ -0,0 +1,36 @@
+"""
+Nozomi
+Not Modified Error Module
+Copyright Amatino Pty Ltd
+"""
+from nozomi.errors.error import NozomiError
+from nozomi.http.status_code import HTTPStatusCode
+from nozomi.ancillary.immutable import Immutable
+
+
+class NotModified(NozomiError):
+    """
+    Raised when a client already holds the current version of a requested
+    resource, per its If-None-Match header. Respond with a 304 status, the
+    supplied ETag in an ETag header, and no body. The `.info_package` of
+    a NotModified error is minimal, bearing an empty description and the
+    304 response code, such that generic handlers serialising it for any
+    NozomiError do not fail, though a 304 response should omit it.
+    """
+
+    def __init__(
+        self,
+        etag: str,
+        client_description: str = ''
+    ) -> None:
+
+        self._etag = etag
+
+        super().__init__(
+            client_description=client_description,
+            http_status_code=HTTPStatusCode.NOT_MODIFIED
+        )
+
+        return
+
+    etag: str = Immutable(lambda s: s._etag)
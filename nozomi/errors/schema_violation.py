@@ -0,0 +1,36 @@
+"""
+Nozomi
+Schema Violation Error Module
+Copyright Amatino Pty Ltd
+"""
+from nozomi.errors.bad_request import BadRequest
+from nozomi.ancillary.immutable import Immutable
+from typing import List, Dict, Any
+
+
+class SchemaViolation(BadRequest):
+    """
+    A BadRequest describing every way in which request data violated a
+    RequestSchema
+    """
+
+    def __init__(self, violations: List[str]) -> None:
+
+        assert isinstance(violations, list)
+        self._violations = violations
+
+        super().__init__(
+            client_description='; '.join(violations)
+        )
+
+        return
+
+    violations: List[str] = Immutable(lambda s: list(s._violations))
+
+    def _info_package(self) -> Dict[str, Any]:
+        data = {
+            'error-information': self.client_description,
+            'response-code': self.http_status_code.value,
+            'violations': list(self._violations)
+        }
+        return BadRequest._InfoPackage(data)
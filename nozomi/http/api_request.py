@@ -7,18 +7,47 @@ from nozomi.http.method import HTTPMethod
 from nozomi.ancillary.configuration import Configuration
 from nozomi.ancillary.immutable import Immutable
 from nozomi.http.url_parameters import URLParameters
-from urllib.request import Request
-from urllib.request import urlopen
-from typing import Any, Optional, TypeVar, Dict
+from nozomi.http.connection_pool import ConnectionPool
+from nozomi.http.response_cache import ResponseCache, CachedResponse, Key
+from typing import Any, Optional, TypeVar, Dict, List, Type
+from concurrent.futures import ThreadPoolExecutor
 from urllib.request import HTTPError
+from urllib.parse import urlsplit
+import threading
+import functools
+import asyncio
 import json
+import io
 from nozomi.security.request_credentials import RequestCredentials
 
 T = TypeVar('T', bound='ApiRequest')
 
+_EXECUTOR_LOCK = threading.Lock()
+_WORKER = threading.local()
+
 
 class ApiRequest:
-    """A request to a Nozomi-compliant API via HTTP"""
+    """
+    A request to a Nozomi-compliant API via HTTP. Requests are sent over
+    persistent connections drawn from a pool shared by all requests to the
+    same origin, sized and timed per Configuration.api_pool_size,
+    .api_timeout_seconds and .api_idle_seconds. The pool size bounds idle
+    connections retained, not concurrent requests. See ConnectionPool.
+
+    Requests are sent directly to Configuration.api_endpoint. Redirects
+    are not followed, and raise HTTPError, and environment proxy settings
+    are ignored, such that the endpoint must be directly reachable. As
+    under `urlopen`, failures to connect raise URLError.
+
+    Independent requests may be sent concurrently with `.gather()`, or
+    awaited with `.async_send()`.
+
+    If Configuration.api_cache_bytes is greater than zero, GET responses
+    are cached and revalidated per their ETag, Last-Modified and
+    Cache-Control headers. See ResponseCache.
+    """
+
+    _executor: Optional[ThreadPoolExecutor] = None
 
     def __init__(
         self,
@@ -36,29 +65,155 @@ class ApiRequest:
 
         headers: Dict[str, str] = dict()
         if credentials is not None:
-            headers = credentials.dictionary
+            headers = dict(credentials.dictionary)
 
         if data is not None:
             data = json.dumps(data).encode('utf-8')
             headers['content-type'] = 'application/json'
 
-        request = Request(
+        pieces = urlsplit(url)
+        target = pieces.path or '/'
+        if pieces.query:
+            target += '?' + pieces.query
+
+        cache: Optional[ResponseCache] = None
+        key: Optional[Key] = None
+        cached: Optional[CachedResponse] = None
+
+        if configuration.api_cache_bytes > 0:
+            cache = ResponseCache.shared(configuration.api_cache_bytes)
+            if method != HTTPMethod.GET:
+                cache.invalidate(url)
+            else:
+                key = cache.key(method.value, url, headers)
+                cached = cache.get(key)
+
+        if cached is not None:
+            if cached.is_fresh:
+                self._response_data = cached.data
+                return
+            headers.update(cached.conditions())
+
+        pool = ConnectionPool.shared(
             url,
-            method=method.value,
-            data=data,
+            size=configuration.api_pool_size,
+            timeout=configuration.api_timeout_seconds,
+            idle_seconds=configuration.api_idle_seconds
+        )
+
+        response, body = pool.request(
+            method.value,
+            target,
+            body=data,
             headers=headers
         )
 
-        try:
-            response = urlopen(request).read()
-        except HTTPError as error:
-            if error.code == 404:
+        if response.status == 304 and cached is not None:
+            cache.refresh(key, response.headers)
+            self._response_data = cached.data
+            return
+
+        if not 200 <= response.status < 300:
+            if response.status == 404:
                 self._response_data = None
                 return
-            raise
+            raise HTTPError(
+                url,
+                response.status,
+                response.reason,
+                response.headers,
+                io.BytesIO(body)
+            )
+
+        self._response_data = json.loads(body)
 
-        self._response_data = json.loads(response)
+        if key is not None:
+            cache.store(key, response.headers, len(body), self._response_data)
 
         return
 
     response_data = Immutable(lambda s: s._response_data)
+
+    @classmethod
+    def gather(cls: Type[T], requests: List[Dict[str, Any]]) -> List[T]:
+        """
+        Return ApiRequests sent concurrently, in the order supplied, each
+        described by a dictionary of ApiRequest initialiser arguments. As
+        for a single request, a request receiving a 404 has `response_data`
+        of None. If any request fails, the first such error is raised once
+        all requests have completed.
+
+        When called from a request already running on the shared executor,
+        for example from an ApiRequest subclass, requests are sent one at a
+        time on the calling thread, as awaiting the executor from one of its
+        own threads could deadlock. The first error is then raised at once.
+
+        Example:
+            session, profile = ApiRequest.gather([
+                {'path': '/session', 'method': HTTPMethod.GET, ...},
+                {'path': '/profile', 'method': HTTPMethod.GET, ...}
+            ])
+        """
+        if len(requests) < 1:
+            return []
+        if len(requests) == 1 or getattr(_WORKER, 'active', False):
+            return [cls(**r) for r in requests]
+        executor = cls._shared_executor(requests[0]['configuration'])
+        futures = [executor.submit(cls._send_in_worker, r) for r in requests]
+        errors = [f.exception() for f in futures]
+        for error in errors:
+            if error is not None:
+                raise error
+            continue
+        return [f.result() for f in futures]
+
+    @classmethod
+    async def async_send(
+        cls: Type[T],
+        path: str,
+        method: HTTPMethod,
+        configuration: Configuration,
+        data: Optional[Any] = None,
+        url_parameters: Optional[URLParameters] = None,
+        credentials: Optional[RequestCredentials] = None
+    ) -> T:
+        """
+        Return an ApiRequest sent without blocking the running event loop.
+        Requests may be awaited concurrently, for example via
+        `asyncio.gather()`.
+        """
+        return await asyncio.get_event_loop().run_in_executor(
+            cls._shared_executor(configuration),
+            functools.partial(cls._send_in_worker, {
+                'path': path,
+                'method': method,
+                'configuration': configuration,
+                'data': data,
+                'url_parameters': url_parameters,
+                'credentials': credentials
+            })
+        )
+
+    @classmethod
+    def _send_in_worker(cls: Type[T], arguments: Dict[str, Any]) -> T:
+        # Mark this executor thread, such that nested calls to .gather()
+        # run inline rather than awaiting the executor they occupy
+        _WORKER.active = True
+        return cls(**arguments)
+
+    @classmethod
+    def _shared_executor(
+        cls,
+        configuration: Configuration
+    ) -> ThreadPoolExecutor:
+        # Threads are sized to the connection pool, such that concurrent
+        # requests do not open connections the pool cannot retain
+        if ApiRequest._executor is not None:
+            return ApiRequest._executor
+        with _EXECUTOR_LOCK:
+            if ApiRequest._executor is None:
+                ApiRequest._executor = ThreadPoolExecutor(
+                    max_workers=max(1, configuration.api_pool_size),
+                    thread_name_prefix='nozomi-api-request'
+                )
+        return ApiRequest._executor
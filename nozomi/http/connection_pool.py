@@ -0,0 +1,218 @@
+"""
+Nozomi
+Connection Pool Module
+Copyright Amatino Pty Ltd
+"""
+from nozomi.ancillary.immutable import Immutable
+from http.client import HTTPConnection, HTTPSConnection, HTTPResponse
+from http.client import RemoteDisconnected, CannotSendRequest
+from urllib.parse import urlsplit
+from urllib.error import URLError
+from typing import Dict, List, Optional, Tuple, TypeVar, Type
+import threading
+import select
+import time
+
+T = TypeVar('T', bound='ConnectionPool')
+
+_SHARED_LOCK = threading.Lock()
+
+
+class ConnectionPool:
+    """
+    A threadsafe pool of persistent HTTP/1.1 connections to a single
+    origin, such as `http://localhost:8080`. Connections are kept alive
+    between requests, such that TCP and TLS setup is paid once per
+    connection rather than once per request.
+
+    Any number of requests may proceed at once: `size` bounds the number
+    of idle connections retained for reuse, not the number open at once,
+    and a request finding no idle connection opens a new one. Idle
+    connections are discarded after `idle_seconds`, before servers are
+    likely to close them.
+
+    Requests are sent directly to the origin. Unlike `urllib.request`,
+    the pool does not follow redirects, returning 3xx responses as
+    received, and does not use proxies configured in the environment,
+    such as via `HTTP_PROXY` or `HTTPS_PROXY`.
+
+    A request failing on a reused connection that the server has closed is
+    retried once on a fresh connection, if the request was never sent or
+    its method is idempotent.
+
+    As with `urllib.request.urlopen`, socket errors raised while
+    connecting or sending a request, such as a refused connection or a
+    connection timeout, are raised as URLError, with the original error
+    as its `.reason`. Errors raised while reading a response propagate
+    unwrapped, also as with `urlopen`.
+    """
+
+    _IDEMPOTENT = frozenset(('GET', 'HEAD', 'PUT', 'DELETE', 'OPTIONS'))
+    _STALE = (
+        RemoteDisconnected,
+        CannotSendRequest,
+        ConnectionResetError,
+        BrokenPipeError
+    )
+
+    _shared: Dict[Tuple[str, str], 'ConnectionPool'] = dict()
+
+    def __init__(
+        self,
+        origin: str,
+        size: int = 8,
+        timeout: float = 30,
+        idle_seconds: float = 30
+    ) -> None:
+
+        assert isinstance(size, int)
+        assert size >= 0
+
+        pieces = urlsplit(origin)
+        if pieces.scheme not in ('http', 'https'):
+            raise ValueError('Unsupported origin: ' + str(origin))
+
+        self._scheme = pieces.scheme
+        self._host = pieces.hostname
+        self._port = pieces.port
+        self._size = size
+        self._timeout = timeout
+        self._idle_seconds = idle_seconds
+        self._idle: List[Tuple[float, HTTPConnection]] = list()
+        self._lock = threading.Lock()
+
+        return
+
+    size: int = Immutable(lambda s: s._size)
+    timeout: float = Immutable(lambda s: s._timeout)
+    idle_seconds: float = Immutable(lambda s: s._idle_seconds)
+
+    def request(
+        self,
+        method: str,
+        target: str,
+        body: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> Tuple[HTTPResponse, bytes]:
+        """
+        Return a response to a request for a supplied target, the path and
+        query portion of a URL, along with the response body. The body is
+        read in full, such that the connection may be reused.
+        """
+        headers = dict() if headers is None else headers
+
+        while True:
+            connection, reused = self._acquire()
+            sent = False
+            try:
+                connection.request(method, target, body=body, headers=headers)
+                sent = True
+                response = connection.getresponse()
+                data = response.read()
+            except self._STALE as error:
+                connection.close()
+                if reused and (not sent or method in self._IDEMPOTENT):
+                    continue
+                if not sent and isinstance(error, OSError):
+                    raise URLError(error) from error
+                raise
+            except OSError as error:
+                connection.close()
+                if not sent:
+                    raise URLError(error) from error
+                raise
+            except BaseException:
+                connection.close()
+                raise
+
+            if response.will_close:
+                connection.close()
+            else:
+                self._release(connection)
+
+            return response, data
+
+    def close(self) -> None:
+        """Close all idle connections"""
+        with self._lock:
+            idle = self._idle
+            self._idle = list()
+        for _, connection in idle:
+            connection.close()
+            continue
+        return
+
+    def __len__(self) -> int:
+        return len(self._idle)
+
+    def _acquire(self) -> Tuple[HTTPConnection, bool]:
+        now = time.monotonic()
+        while True:
+            with self._lock:
+                if not self._idle:
+                    break
+                released, connection = self._idle.pop()
+            if now - released < self._idle_seconds and not self._dropped(
+                connection
+            ):
+                return connection, True
+            connection.close()
+            continue
+
+        if self._scheme == 'https':
+            return HTTPSConnection(
+                self._host,
+                self._port,
+                timeout=self._timeout
+            ), False
+        return HTTPConnection(
+            self._host,
+            self._port,
+            timeout=self._timeout
+        ), False
+
+    def _release(self, connection: HTTPConnection) -> None:
+        with self._lock:
+            if len(self._idle) < self._size:
+                self._idle.append((time.monotonic(), connection))
+                return
+        connection.close()
+        return
+
+    @staticmethod
+    def _dropped(connection: HTTPConnection) -> bool:
+        # An idle connection should have nothing to read. If it is readable,
+        # the server has closed it, or sent something unexpected.
+        if connection.sock is None:
+            return True
+        try:
+            return bool(select.select([connection.sock], [], [], 0)[0])
+        except (OSError, ValueError):
+            return True
+
+    @classmethod
+    def shared(
+        cls: Type[T],
+        origin: str,
+        size: int = 8,
+        timeout: float = 30,
+        idle_seconds: float = 30
+    ) -> T:
+        """
+        Return a process-wide pool for the origin of a supplied URL,
+        creating it with the supplied parameters if need be
+        """
+        pieces = urlsplit(origin)
+        key = (pieces.scheme, pieces.netloc)
+        pool = cls._shared.get(key)
+        if pool is not None:
+            return pool
+        with _SHARED_LOCK:
+            if key not in cls._shared:
+                cls._shared[key] = cls(
+                    pieces.scheme + '://' + pieces.netloc,
+                    size=size,
+                    timeout=timeout,
+                    idle_seconds=idle_seconds
+                )
+        return cls._shared[key]
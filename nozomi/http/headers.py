@@ -3,7 +3,7 @@ Nozomi
 HTTP Headers Module
 Copyright Amatino Pty Ltd
 """
-from typing import Optional, List
+from typing import Optional, List, Dict
 from collections.abc import Mapping
 from nozomi.errors.error import NozomiError
 from nozomi.ancillary.immutable import Immutable
@@ -23,28 +23,55 @@ Headers initialiser.'
 
     def __init__(self, raw: Mapping = {}) -> None:
         self._raw = raw
+        self._index: Optional[Dict[str, List[str]]] = None
+        self._cookies: Optional[Dict[str, str]] = None
         return
 
     dictionary = Immutable(lambda s: s._raw)
 
-    def value_for(self, key: str) -> Optional[str]:
+    def _indexed(self) -> Dict[str, List[str]]:
         """
-        Return the value of a supplied header key, or None if no value
-        exists for that key.
+        Return an index of all header values by lowercase key, building it
+        on first use
         """
-        value = self._raw.get(key)
-        if value is None:
+        if self._index is not None:
+            return self._index
+
+        if isinstance(self._raw, Headers):
+            self._index = {
+                k: list(v) for k, v in self._raw._indexed().items()
+            }
+            return self._index
+
+        index: Dict[str, List[str]] = dict()
+        multiple = hasattr(self._raw, 'getlist')
+        for item in self._raw:
+            if isinstance(item, tuple) and len(item) > 1:
+                if isinstance(item[0], str):
+                    index.setdefault(item[0].lower(), []).append(item[1])
+                continue
+            if not isinstance(item, str):
+                continue
+            values = index.setdefault(item.lower(), [])
+            if multiple is True:
+                values.extend(self._raw.getlist(item))
+                continue
+            values.append(self._raw[item])
+            continue
 
-            for item in self._raw:
-                if isinstance(item, tuple) and len(item) > 1:
-                    if isinstance(item[0], str):
-                        if item[0].lower() == key.lower():
-                            return item[1]
-                if isinstance(item, str) and item.lower() == key.lower():
-                    return self._raw[key.lower()]
+        self._index = index
+        return index
 
+    def value_for(self, key: str) -> Optional[str]:
+        """
+        Return the value of a supplied header key, or None if no value
+        exists for that key. Keys are case-insensitive.
+        """
+        values = self._indexed().get(key.lower())
+        if not values:
             return None
 
+        value = values[0]
         if not isinstance(value, str):
             raise NozomiError(
                 self._TYPE_ERROR.format(
@@ -57,15 +84,57 @@ Headers initialiser.'
         return value
 
     def getlist(self, key: str) -> List[str]:
+        """
+        Return all values of a supplied header key, in the order received.
+        Keys are case-insensitive.
+        """
+        return list(self._indexed().get(key.lower(), ()))
+
+    def cookies(self) -> Dict[str, str]:
+        """
+        Return a mapping of the names and values of all cookies sent in
+        Cookie headers, parsed on first use and retained for the life of
+        these Headers. Malformed cookies are ignored.
+        """
+        if self._cookies is not None:
+            return self._cookies
+
+        cookies: Dict[str, str] = dict()
+        for header in self._indexed().get('cookie', ()):
+            if isinstance(header, str):
+                cookies.update(self.parse_cookies(header))
+            continue
 
-        if not hasattr(self._raw, 'getlist'):
-            return list()
+        self._cookies = cookies
+        return cookies
 
-        return self._raw.getlist(key)
+    @staticmethod
+    def parse_cookies(raw_cookies: str) -> Dict[str, str]:
+        """
+        Return a mapping of the names and values of cookies in a Cookie
+        header value, in a single pass, ignoring malformed pairs. Where a
+        name repeats, the last value is retained.
+        """
+        cookies: Dict[str, str] = dict()
+        for pair in raw_cookies.split(';'):
+            name, separator, value = pair.partition('=')
+            if not separator:
+                continue
+            name = name.strip()
+            if not name:
+                continue
+            cookies[name] = value.strip()
+            continue
+        return cookies
 
     def add(self, key: str, value: str) -> None:
+        if key.lower() == 'cookie':
+            self._cookies = None
         if (hasattr(self._raw, 'add')):
             self._raw.add(key, value)
+            if self._index is not None:
+                self._index.setdefault(key.lower(), []).append(value)
             return
         self._raw[key] = value
+        self._index = None
         return
@@ -5,6 +5,8 @@ Copyright Amatino Pty Ltd
 """
 from collections.abc import Mapping
 from typing import Optional, Dict, Any, List, TypeVar, Type, Generic
+from typing import FrozenSet
+from functools import lru_cache
 from enum import Enum
 from nozomi.errors.bad_request import BadRequest
 import string
@@ -14,6 +16,13 @@ from nozomi.ancillary.immutable import Immutable
 T = TypeVar('T', bound='ParseableData')
 _Number = TypeVar('_Number')
 
+_WHITESPACE = frozenset(string.whitespace)
+
+
+@lru_cache(maxsize=256)
+def _character_set(characters: str) -> FrozenSet[str]:
+    return frozenset(characters)
+
 
 class ParseableData:
     """Generic parseable data, underlain by a mapping"""
@@ -44,6 +53,13 @@ Supply a key/value mapping object such as a `dict`.')
 
         return ParseableData(data)
 
+    def parse_schema(self, schema: Any) -> Any:
+        """
+        Return a SchemaRecord of values parsed under a supplied RequestSchema,
+        raising a SchemaViolation describing every violation, if any
+        """
+        return schema.parse(self)
+
     def parse_string(
         self,
         key: str,
@@ -96,30 +112,24 @@ Supply a key/value mapping object such as a `dict`.')
             raise BadRequest(f'{hint} min length: {min_length}')
 
         if allow_whitespace is False:
-            if True in [c in value for c in string.whitespace]:
+            if not _WHITESPACE.isdisjoint(value):
                 raise BadRequest(f'Whitespace not allowed for key {hint}')
 
         if allowed_characters is not None:
-            for character in value:
-                if character not in allowed_characters:
-                    raise BadRequest('Value for key {h} contains unacceptable \
+            if not _character_set(allowed_characters).issuperset(value):
+                raise BadRequest('Value for key {h} contains unacceptable \
 characters. Acceptable characters: {a}'.format(
-                        h=hint,
-                        a=allowed_characters
-                    ))
-                continue
-            pass
-    
+                    h=hint,
+                    a=allowed_characters
+                ))
+
         if disallowed_characters is not None:
-            for character in value:
-                if character in disallowed_characters:
-                    raise BadRequest('Value for key {h} contains unacceptable \
+            if not _character_set(disallowed_characters).isdisjoint(value):
+                raise BadRequest('Value for key {h} contains unacceptable \
 characters. Unacceptable characters: {d}'.format(
-                        h=hint,
-                        d=disallowed_characters
-                    ))
-                continue
-            pass
+                    h=hint,
+                    d=disallowed_characters
+                ))
 
         return value
 
@@ -9,18 +9,42 @@ from nozomi.http.status_code import HTTPStatusCode
 from nozomi.errors.bad_request import BadRequest
 from nozomi.errors.error import NozomiError
 from nozomi.data.xml import XML
-from typing import Optional, TypeVar
+from typing import Optional, TypeVar, Union, IO, Any
 import json
 
 Self = TypeVar('Self', bound='RequestBody')
 
 
+class _LimitedStream:
+    """Reads at most `limit` bytes from a wrapped file-like object"""
+
+    def __init__(self, stream: IO[bytes], limit: int) -> None:
+        self._stream = stream
+        self._remaining = limit
+        return
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        if size is None or size < 0 or size > self._remaining:
+            size = self._remaining
+        if size == 0:
+            return b''
+        chunk = self._stream.read(size)
+        self._remaining -= len(chunk)
+        return chunk
+
+
 class RequestBody(ParseableData):
+    """
+    Data parsed from the body of a request. The body may be supplied as
+    bytes, or as a file-like object such as a WSGI input stream, from which
+    at most content-length bytes are read. XML bodies supplied as a stream
+    are parsed incrementally.
+    """
 
     def __init__(
         self,
         headers: Headers,
-        request_body: bytes,
+        request_body: Union[bytes, IO[bytes]],
         max_content_length: int = 10000
     ) -> None:
 
@@ -38,6 +62,16 @@ class RequestBody(ParseableData):
                 s=str(max_content_length)
             ), HTTPStatusCode.PAYLOAD_TOO_LARGE.value)
 
+        if hasattr(request_body, 'read'):
+            request_body = _LimitedStream(request_body, content_length)
+            content_type = headers.value_for('content-type')
+            if (
+                content_type is not None
+                and content_type.lower().split(';')[0] == 'application/xml'
+            ):
+                return super().__init__(raw=self._parse_xml(request_body))
+            request_body = request_body.read()
+
         try:
             string_data = request_body.decode('utf-8')
         except Exception:
@@ -64,20 +98,25 @@ lease check the syntax of your request body.')
             return super().__init__(raw=json_data)
 
         if content_type_value == 'application/xml':
-            try:
-                xml_data = XML.xmlstring_to_data(string_data)
-            except Exception:
-                raise BadRequest('Unable to parse your request body as xml. Pl\
-ease check the syntax of your request body.')
-            return super().__init__(raw=xml_data)
+            return super().__init__(raw=self._parse_xml(string_data))
 
         raise BadRequest('Invalid content type. Valid content types are applic\
 ation/json and application/xml only.')
 
+    @staticmethod
+    def _parse_xml(data: Union[str, _LimitedStream]) -> Any:
+        try:
+            if isinstance(data, str):
+                return XML.xmlstring_to_data(data)
+            return XML.stream_to_data(data)
+        except Exception:
+            raise BadRequest('Unable to parse your request body as xml. Pleas\
+e check the syntax of your request body.')
+
     @staticmethod
     def optionally_suppressing_exceptions_as_none(
         headers: Headers,
-        request_body: bytes,
+        request_body: Union[bytes, IO[bytes]],
         max_content_length: int = 10000
     ) -> Optional[Self]:
         
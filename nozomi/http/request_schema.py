@@ -0,0 +1,489 @@
+"""
+Nozomi
+Request Schema Module
+Copyright Amatino Pty Ltd
+"""
+from collections.abc import Mapping
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Dict, List, Optional, Type, Union, Tuple, Callable
+from nozomi.errors.schema_violation import SchemaViolation
+from nozomi.http.parseable_data import ParseableData
+from nozomi.ancillary.immutable import Immutable
+import keyword
+import string
+import re
+
+_WHITESPACE = frozenset(string.whitespace)
+
+
+class SchemaField:
+    """
+    Abstract declaration of a rule for a single key in request data. Rules
+    are compiled once, when the field is declared.
+    """
+
+    def __init__(self, required: bool = True) -> None:
+        assert isinstance(required, bool)
+        self._required = required
+        return
+
+    required: bool = Immutable(lambda s: s._required)
+
+    def validate(self, value: Any, hint: str, violations: List[str]) -> Any:
+        """
+        Return a parsed form of a non-null value, appending a description of
+        each violation of this field's rules to `violations`
+        """
+        raise NotImplementedError
+
+    @staticmethod
+    def _constrain(
+        number: Any,
+        hint: str,
+        min_value: Optional[Any],
+        max_value: Optional[Any],
+        violations: List[str]
+    ) -> Any:
+        if min_value is not None and number < min_value:
+            violations.append(f'{hint} below mininum value: {min_value}')
+        if max_value is not None and number > max_value:
+            violations.append(f'{hint} above maximum value: {max_value}')
+        return number
+
+
+class StringField(SchemaField):
+
+    def __init__(
+        self,
+        required: bool = True,
+        max_length: Optional[int] = None,
+        min_length: Optional[int] = None,
+        allow_whitespace: bool = False,
+        allowed_characters: Optional[str] = None,
+        disallowed_characters: Optional[str] = None,
+        pattern: Optional[str] = None
+    ) -> None:
+
+        super().__init__(required)
+        self._max_length = max_length
+        self._min_length = min_length
+        self._allow_whitespace = allow_whitespace
+        self._allowed_characters = allowed_characters
+        self._disallowed_characters = disallowed_characters
+        self._allowed = None if allowed_characters is None else frozenset(
+            allowed_characters
+        )
+        self._disallowed = None if disallowed_characters is None else (
+            frozenset(disallowed_characters)
+        )
+        self._pattern = None if pattern is None else re.compile(pattern)
+        return
+
+    def validate(self, value: Any, hint: str, violations: List[str]) -> Any:
+
+        if not isinstance(value, str):
+            violations.append(f'Value for key {hint} must be string')
+            return None
+
+        if self._max_length is not None and len(value) > self._max_length:
+            violations.append(f'{hint} max length: {self._max_length}')
+
+        if self._min_length is not None and len(value) < self._min_length:
+            violations.append(f'{hint} min length: {self._min_length}')
+
+        characters = frozenset(value)
+
+        if self._allow_whitespace is False:
+            if not characters.isdisjoint(_WHITESPACE):
+                violations.append(f'Whitespace not allowed for key {hint}')
+
+        if self._allowed is not None and not characters <= self._allowed:
+            violations.append('Value for key {h} contains unacceptable \
+characters. Acceptable characters: {a}'.format(
+                h=hint,
+                a=self._allowed_characters
+            ))
+
+        if (
+            self._disallowed is not None
+            and not characters.isdisjoint(self._disallowed)
+        ):
+            violations.append('Value for key {h} contains unacceptable \
+characters. Unacceptable characters: {d}'.format(
+                h=hint,
+                d=self._disallowed_characters
+            ))
+
+        if self._pattern is not None and not self._pattern.fullmatch(value):
+            violations.append('Value for key {h} must match pattern \
+{p}'.format(h=hint, p=self._pattern.pattern))
+
+        return value
+
+
+class IntegerField(SchemaField):
+
+    def __init__(
+        self,
+        required: bool = True,
+        max_value: Optional[int] = None,
+        min_value: Optional[int] = None
+    ) -> None:
+        super().__init__(required)
+        self._max_value = max_value
+        self._min_value = min_value
+        return
+
+    def validate(self, value: Any, hint: str, violations: List[str]) -> Any:
+        error = f'{hint} must be integer or string encoded integer'
+        if isinstance(value, bool):
+            violations.append(error)
+            return None
+        try:
+            number = int(value)
+        except Exception:
+            violations.append(error)
+            return None
+        return self._constrain(
+            number,
+            hint,
+            self._min_value,
+            self._max_value,
+            violations
+        )
+
+
+class FloatField(SchemaField):
+
+    def __init__(
+        self,
+        required: bool = True,
+        max_value: Optional[float] = None,
+        min_value: Optional[float] = None
+    ) -> None:
+        super().__init__(required)
+        self._max_value = max_value
+        self._min_value = min_value
+        return
+
+    def validate(self, value: Any, hint: str, violations: List[str]) -> Any:
+        error = f'{hint} must be float or string encoded float'
+        if isinstance(value, bool):
+            violations.append(error)
+            return None
+        try:
+            number = float(value)
+        except Exception:
+            violations.append(error)
+            return None
+        return self._constrain(
+            number,
+            hint,
+            self._min_value,
+            self._max_value,
+            violations
+        )
+
+
+class DecimalField(SchemaField):
+
+    def __init__(
+        self,
+        required: bool = True,
+        max_value: Optional[Decimal] = None,
+        min_value: Optional[Decimal] = None
+    ) -> None:
+        super().__init__(required)
+        self._max_value = max_value
+        self._min_value = min_value
+        return
+
+    def validate(self, value: Any, hint: str, violations: List[str]) -> Any:
+        try:
+            number = Decimal(str(value).replace(',', ''))
+        except Exception:
+            violations.append('{k} must be a string encoded decimal, optional\
+ly with a `.` character as the fractional separator. The `,` character will b\
+e ignored'.format(k=hint))
+            return None
+        return self._constrain(
+            number,
+            hint,
+            self._min_value,
+            self._max_value,
+            violations
+        )
+
+
+class BooleanField(SchemaField):
+
+    _VALUES = {True: True, False: False, 'true': True, 'false': False}
+
+    def validate(self, value: Any, hint: str, violations: List[str]) -> Any:
+        if isinstance(value, (bool, str)) and value in self._VALUES:
+            return self._VALUES[value]
+        violations.append(f'{hint} must be "true" or "false"')
+        return None
+
+
+class EnumField(SchemaField):
+
+    def __init__(
+        self,
+        enum_type: Type[Enum],
+        type_name: str,
+        required: bool = True
+    ) -> None:
+        super().__init__(required)
+        self._type_name = type_name
+        self._members: Dict[Any, Enum] = dict()
+        for member in enum_type:
+            self._members[(type(member.value), member.value)] = member
+            if isinstance(member.value, int):
+                self._members[(str, str(member.value))] = member
+            continue
+        self._acceptable = str([m.value for m in enum_type])
+        return
+
+    def validate(self, value: Any, hint: str, violations: List[str]) -> Any:
+        try:
+            return self._members[(type(value), value)]
+        except (KeyError, TypeError):
+            pass
+        violations.append('Bad {t} value for enumeration at key {k}. Accept\
+able values: {v}'.format(
+            t=self._type_name,
+            k=hint,
+            v=self._acceptable
+        ))
+        return None
+
+
+class ArrayField(SchemaField):
+    """
+    An array of values, each satisfying a supplied element field. With a
+    delimiter, the array may instead be supplied as a delimited string.
+    """
+
+    def __init__(
+        self,
+        element: SchemaField,
+        required: bool = True,
+        min_elements: Optional[int] = None,
+        max_elements: Optional[int] = None,
+        delimiter: Optional[str] = None
+    ) -> None:
+        assert isinstance(element, SchemaField)
+        super().__init__(required)
+        self._element = element
+        self._min_elements = min_elements
+        self._max_elements = max_elements
+        self._delimiter = delimiter
+        return
+
+    def validate(self, value: Any, hint: str, violations: List[str]) -> Any:
+
+        if self._delimiter is not None and isinstance(value, str):
+            value = value.split(self._delimiter) if value else []
+
+        if not isinstance(value, list):
+            violations.append(f'Value for key {hint} must be array')
+            return None
+
+        if self._min_elements is not None and len(value) < self._min_elements:
+            violations.append('{k} array minimum elements is {i}'.format(
+                k=hint,
+                i=str(self._min_elements)
+            ))
+
+        if self._max_elements is not None and len(value) > self._max_elements:
+            violations.append('{k} array maximum length is {i}'.format(
+                k=hint,
+                i=str(self._max_elements)
+            ))
+
+        validate = self._element.validate
+        return [validate(v, hint, violations) for v in value]
+
+
+class SchemaRecord:
+    """
+    Base of the slotted records returned by RequestSchema.parse(). Each
+    schema compiles its own subclass, with one attribute per schema key.
+    Keys that are not Python identifiers are available as attributes with
+    non-identifier characters replaced by underscores, and by subscript.
+    """
+    __slots__ = ()
+
+    _keys: Tuple[Tuple[str, str], ...] = tuple()
+    _attributes: Dict[str, str] = dict()
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {k: getattr(self, a) for k, a in self._keys}
+
+    def __getitem__(self, key: str) -> Any:
+        return getattr(self, self._attributes[key])
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return False
+        return self.as_dict() == other.as_dict()
+
+    def __repr__(self) -> str:
+        return type(self).__name__ + '(' + ', '.join(
+            a + '=' + repr(getattr(self, a)) for _, a in self._keys
+        ) + ')'
+
+
+class RequestSchema:
+    """
+    A declarative, precompiled description of acceptable request data,
+    mapping keys to SchemaFields. A schema is compiled once, when declared,
+    into a single parse function returning a slotted SchemaRecord. Parsing
+    raises a SchemaViolation describing all violations at once, rather than
+    only the first.
+
+    Declare a schema once per Resource subclass, as `request_schema`, and
+    parse bodies with `Resource.parse_body()`.
+
+    Example:
+        request_schema = RequestSchema({
+            'name': StringField(max_length=64, allow_whitespace=True),
+            'count': IntegerField(min_value=1),
+            'colour': EnumField(Colour, 'colour', required=False)
+        }, name='Widget')
+        record = self.parse_body(body)
+        record.count
+    """
+
+    def __init__(
+        self,
+        fields: Dict[str, SchemaField],
+        allow_unknown_keys: bool = True,
+        inside: Optional[str] = None,
+        name: str = 'Record'
+    ) -> None:
+
+        assert isinstance(fields, dict)
+        assert isinstance(allow_unknown_keys, bool)
+        assert name.isidentifier()
+
+        self._fields = fields
+        self._allow_unknown_keys = allow_unknown_keys
+        self._inside = inside
+        self._record_type = self._compile_record(name, list(fields.keys()))
+        self._parse = self._compile_parse()
+
+        return
+
+    record_type: Type[SchemaRecord] = Immutable(lambda s: s._record_type)
+
+    def parse(self, data: Union[ParseableData, Mapping]) -> SchemaRecord:
+        """
+        Return a record of parsed values, with None for absent optional
+        keys. Raise a SchemaViolation if the data violates the schema in any
+        way.
+        """
+        raw = data.raw if isinstance(data, ParseableData) else data
+        if not isinstance(raw, Mapping):
+            raise SchemaViolation(['Expected a key/value object'])
+        return self._parse(raw)
+
+    @staticmethod
+    def _attribute(key: str) -> str:
+        attribute = re.sub(r'\W', '_', key)
+        if not attribute or attribute[0].isdigit():
+            attribute = '_' + attribute
+        if keyword.iskeyword(attribute):
+            attribute += '_'
+        return attribute
+
+    @classmethod
+    def _compile_record(
+        cls,
+        name: str,
+        keys: List[str]
+    ) -> Type[SchemaRecord]:
+
+        attributes = [cls._attribute(k) for k in keys]
+        if len(set(attributes)) != len(attributes):
+            raise ValueError('Schema keys collide as attributes: ' + str(keys))
+        for attribute in attributes:
+            if hasattr(SchemaRecord, attribute):
+                raise ValueError('Reserved schema key: ' + attribute)
+            continue
+
+        source = [
+            'def __init__(self' + ''.join(', a' + str(i) for i in range(
+                len(attributes)
+            )) + '):'
+        ] + [
+            '    self.' + a + ' = a' + str(i) for i, a in enumerate(attributes)
+        ] + ['    return']
+
+        namespace: Dict[str, Any] = dict()
+        exec('\n'.join(source), namespace)
+
+        return type(name, (SchemaRecord,), {
+            '__slots__': tuple(attributes),
+            '__init__': namespace['__init__'],
+            '_keys': tuple(zip(keys, attributes)),
+            '_attributes': dict(zip(keys, attributes))
+        })
+
+    def _compile_parse(self) -> Callable[[Mapping], SchemaRecord]:
+
+        namespace: Dict[str, Any] = {
+            'Record': self._record_type,
+            'SchemaViolation': SchemaViolation,
+            'keys': frozenset(self._fields.keys())
+        }
+
+        source = [
+            'def parse(raw):',
+            '    violations = []',
+            '    get = raw.get'
+        ]
+
+        for index, (key, field) in enumerate(self._fields.items()):
+            value = 'v' + str(index)
+            validate = 'f' + str(index)
+            hint = key if self._inside is None else f'{self._inside}->{key}'
+            namespace[validate] = field.validate
+            source += [
+                '    ' + value + ' = get(' + repr(key) + ')',
+                '    if ' + value + ' is not None:',
+                '        ' + value + ' = ' + validate + '(' + value + ', '
+                + repr(hint) + ', violations)'
+            ]
+            if field.required is True:
+                source += [
+                    '    else:',
+                    '        violations.append(' + repr(
+                        'Missing value for key ' + hint
+                    ) + ')'
+                ]
+            continue
+
+        if self._allow_unknown_keys is False:
+            prefix = '' if self._inside is None else self._inside + '->'
+            source += [
+                '    for key in raw.keys():',
+                '        if key not in keys:',
+                '            violations.append(' + repr(
+                    'Unexpected key ' + prefix
+                ) + ' + str(key))'
+            ]
+
+        source += [
+            '    if violations:',
+            '        raise SchemaViolation(violations)',
+            '    return Record(' + ', '.join(
+                'v' + str(i) for i in range(len(self._fields))
+            ) + ')'
+        ]
+
+        exec('\n'.join(source), namespace)
+
+        return namespace['parse']
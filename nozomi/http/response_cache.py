@@ -0,0 +1,268 @@
+"""
+Nozomi
+Response Cache Module
+Copyright Amatino Pty Ltd
+"""
+from nozomi.ancillary.immutable import Immutable
+from collections import OrderedDict
+from email.message import Message
+from urllib.parse import urlsplit
+from typing import Any, Dict, Optional, Set, Tuple, TypeVar, Type
+import threading
+import time
+
+T = TypeVar('T', bound='ResponseCache')
+
+Key = Tuple[str, str, Tuple[Tuple[str, str], ...]]
+
+_SHARED_LOCK = threading.Lock()
+
+
+def _copy(data: Any) -> Any:
+    """
+    Return a copy of decoded JSON data, copying only its objects and
+    arrays, which is several times faster than `copy.deepcopy()`
+    """
+    kind = type(data)
+    if kind is dict:
+        return {k: _copy(v) for k, v in data.items()}
+    if kind is list:
+        return [_copy(v) for v in data]
+    return data
+
+
+class CachedResponse:
+    """
+    Decoded response data retained by a ResponseCache. Data is copied on
+    its way into and out of the cache, such that each caller receives its
+    own copy, which it may freely mutate, without decoding the response
+    body again.
+    """
+
+    __slots__ = ('_data', 'size', 'etag', 'last_modified', 'expiry')
+
+    def __init__(
+        self,
+        data: Any,
+        size: int,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        expiry: float
+    ) -> None:
+        self._data = _copy(data)
+        self.size = size
+        self.etag = etag
+        self.last_modified = last_modified
+        self.expiry = expiry
+        return
+
+    is_fresh: bool = Immutable(lambda s: s.expiry > time.monotonic())
+    data: Any = Immutable(lambda s: _copy(s._data))
+
+    def conditions(self) -> Dict[str, str]:
+        """Return headers making a request conditional on this response"""
+        conditions: Dict[str, str] = dict()
+        if self.etag is not None:
+            conditions['If-None-Match'] = self.etag
+        if self.last_modified is not None:
+            conditions['If-Modified-Since'] = self.last_modified
+        return conditions
+
+
+class ResponseCache:
+    """
+    A threadsafe, client-side cache of decoded API responses, keyed by
+    method, URL and the credentials supplied with a request, and bounded
+    by the total size of cached response bodies, evicting the least
+    recently used response first.
+
+    Responses are cached if they carry an ETag or Last-Modified header, or
+    a Cache-Control max-age, and not Cache-Control no-store. A response is
+    reused without a request for its max-age, and thereafter revalidated
+    with a conditional request. A 304 response reuses the cached data,
+    without decoding the response body again. Each request receives its
+    own copy of cached data. See CachedResponse.
+
+    Any request other than a GET invalidates cached responses for its URL,
+    less any query, such that a PUT to /things invalidates both /things
+    and /things?limit=10, under any credentials.
+    """
+
+    def __init__(self, capacity_bytes: int) -> None:
+
+        assert isinstance(capacity_bytes, int)
+        assert capacity_bytes > 0
+
+        self._capacity_bytes = capacity_bytes
+        self._size = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._keys_by_resource: Dict[str, Set[Key]] = dict()
+        self._lock = threading.Lock()
+
+        return
+
+    capacity_bytes: int = Immutable(lambda s: s._capacity_bytes)
+    size: int = Immutable(lambda s: s._size)
+
+    _shared: Optional['ResponseCache'] = None
+
+    @staticmethod
+    def key(method: str, url: str, headers: Dict[str, str]) -> Key:
+        """Return a cache key for a request"""
+        return (method, url, tuple(sorted(
+            (k.lower(), str(v)) for k, v in headers.items()
+        )))
+
+    def get(self, key: Key) -> Optional[CachedResponse]:
+        """Return a cached response, marking it as recently used"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def store(
+        self,
+        key: Key,
+        headers: Message,
+        size: int,
+        data: Any
+    ) -> None:
+        """
+        Cache decoded response data, if the supplied response headers
+        permit it
+        """
+        directives = self._directives(headers)
+        etag = headers.get('ETag')
+        last_modified = headers.get('Last-Modified')
+        max_age = self._max_age(directives)
+
+        if 'no-store' in directives or size > self._capacity_bytes:
+            with self._lock:
+                self._remove(key)
+            return
+        if etag is None and last_modified is None and max_age < 1:
+            return
+
+        entry = CachedResponse(
+            data=data,
+            size=size,
+            etag=etag,
+            last_modified=last_modified,
+            expiry=time.monotonic() + max_age
+        )
+
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = entry
+            self._keys_by_resource.setdefault(
+                self._resource(key[1]),
+                set()
+            ).add(key)
+            self._size += size
+            while self._size > self._capacity_bytes:
+                self._remove(next(iter(self._entries)))
+                continue
+
+        return
+
+    def refresh(self, key: Key, headers: Message) -> None:
+        """
+        Update the freshness of a cached response upon its revalidation by
+        a 304 response
+        """
+        directives = self._directives(headers)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return
+            if 'no-store' in directives:
+                self._remove(key)
+                return
+            entry.etag = headers.get('ETag', entry.etag)
+            entry.last_modified = headers.get(
+                'Last-Modified',
+                entry.last_modified
+            )
+            entry.expiry = time.monotonic() + self._max_age(directives)
+        return
+
+    def invalidate(self, url: str) -> None:
+        """
+        Remove all cached responses for a URL, under any query and any
+        credentials
+        """
+        with self._lock:
+            for key in list(self._keys_by_resource.get(
+                self._resource(url),
+                ()
+            )):
+                self._remove(key)
+                continue
+        return
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_resource.clear()
+            self._size = 0
+        return
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, key: Key) -> None:
+        # Callers must hold the lock
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self._size -= entry.size
+        resource = self._resource(key[1])
+        keys = self._keys_by_resource.get(resource)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_resource[resource]
+        return
+
+    @staticmethod
+    def _resource(url: str) -> str:
+        # A URL less its query and fragment
+        pieces = urlsplit(url)
+        return pieces.scheme + '://' + pieces.netloc + pieces.path
+
+    @staticmethod
+    def _directives(headers: Message) -> Dict[str, Optional[str]]:
+        directives: Dict[str, Optional[str]] = dict()
+        for header in headers.get_all('Cache-Control') or ():
+            for directive in header.split(','):
+                name, separator, value = directive.partition('=')
+                name = name.strip().lower()
+                if name:
+                    directives[name] = value.strip().strip('"') or None
+                continue
+            continue
+        return directives
+
+    @staticmethod
+    def _max_age(directives: Dict[str, Optional[str]]) -> int:
+        if 'no-cache' in directives:
+            return 0
+        try:
+            return max(0, int(directives.get('max-age') or 0))
+        except ValueError:
+            return 0
+
+    @classmethod
+    def shared(cls: Type[T], capacity_bytes: int) -> T:
+        """
+        Return a process-wide cache, creating it with the supplied capacity
+        if need be
+        """
+        if cls._shared is not None:
+            return cls._shared
+        with _SHARED_LOCK:
+            if cls._shared is None:
+                cls._shared = cls(capacity_bytes)
+        return cls._shared
@@ -7,15 +7,15 @@ from nozomi.data.datastore import Datastore
 from nozomi.security.internal_key import InternalKey
 from nozomi.resources.resource import Resource
 from nozomi.http.query_string import QueryString
-from typing import Optional, Tuple, Union, List
+from typing import Optional, Tuple, Union, List, Iterator
 from nozomi.security.agent import Agent
 from nozomi.security.broadcastable import Broadcastable
 from nozomi.ancillary.configuration import Configuration
 from nozomi.http.parseable_data import ParseableData
 from nozomi.http.headers import Headers
+from nozomi.http.content_type import ContentType
 from nozomi.security.forwarded_agent import ForwardedAgent
 from nozomi.errors.not_authorised import NotAuthorised
-from nozomi.data.encodable import Encodable
 
 
 class InternalResource(Resource):
@@ -57,8 +57,69 @@ class InternalResource(Resource):
         self,
         body: Optional[ParseableData],
         query: Optional[QueryString],
-        headers: Headers
+        headers: Headers,
+        response_headers: Optional[Headers] = None
     ) -> str:
+        """
+        Return a string response body to a request. If this Resource
+        computes ETags, add the ETag to any supplied `response_headers`.
+        """
+        serialised, etag = self.serve_with_etag(
+            body=body,
+            query=query,
+            headers=headers
+        )
+        self.add_etag(etag, response_headers)
+        return serialised
+
+    def serve_with_etag(
+        self,
+        body: Optional[ParseableData],
+        query: Optional[QueryString],
+        headers: Headers
+    ) -> Tuple[str, Optional[str]]:
+        """
+        Return a string response body to a request, and an ETag for it, if
+        this Resource computes ETags. Raise NotModified if the request's
+        If-None-Match header matches the ETag.
+        """
+        response, authorised_agent = self._compute_authorised_response(
+            body=body,
+            query=query,
+            headers=headers
+        )
+
+        return self._serve_authorised(response, authorised_agent, headers)
+
+    def serve_stream(
+        self,
+        body: Optional[ParseableData],
+        query: Optional[QueryString],
+        headers: Headers,
+        format: ContentType = ContentType.JSON
+    ) -> Iterator[str]:
+        """
+        Return an iterator over chunks of a string response body to a
+        request, broadcast and serialised only as chunks are requested
+        """
+        response, authorised_agent = self._compute_authorised_response(
+            body=body,
+            query=query,
+            headers=headers
+        )
+
+        return self.stream_broadcast(
+            response,
+            authorised_agent,
+            format=format
+        )
+
+    def _compute_authorised_response(
+        self,
+        body: Optional[ParseableData],
+        query: Optional[QueryString],
+        headers: Headers
+    ) -> Tuple[Union[Broadcastable, List[Broadcastable]], Agent]:
 
         ForwardedAgent = self.forwarded_agent_implementation
 
@@ -82,14 +143,4 @@ class InternalResource(Resource):
             raise NotAuthorised
         assert authorised_agent == unauthorised_agent
 
-        self.assert_read_available_to(
-            unauthorised_agent=authorised_agent,
-            broadcast_candidate=response
-        )
-
-        if isinstance(response, list):
-            return Encodable.serialise_many(
-                Broadcastable.broadcast_many_to(response, authorised_agent)
-            )
-
-        return response.broadcast_to(authorised_agent).serialise()
+        return response, authorised_agent
@@ -8,8 +8,9 @@ from nozomi.resources.resource import Resource
 from nozomi.http.query_string import QueryString
 from nozomi.http.parseable_data import ParseableData
 from nozomi.http.headers import Headers
+from nozomi.http.content_type import ContentType
 from nozomi.data.encodable import Encodable
-from typing import Optional, List, Union, Type
+from typing import Optional, List, Union, Type, Iterator, Tuple
 from nozomi.security.abstract_session import AbstractSession
 from nozomi.data.datastore import Datastore
 from nozomi.ancillary.configuration import Configuration
@@ -59,8 +60,83 @@ class OpenResource(Resource):
         self,
         body: Optional[ParseableData],
         query: Optional[QueryString],
-        headers: Headers
+        headers: Headers,
+        response_headers: Optional[Headers] = None
     ) -> str:
+        """
+        Return a string response body to a request. If this Resource
+        computes ETags, add the ETag to any supplied `response_headers`.
+        """
+        serialised, etag = self.serve_with_etag(
+            body=body,
+            query=query,
+            headers=headers
+        )
+        self.add_etag(etag, response_headers)
+        return serialised
+
+    def serve_with_etag(
+        self,
+        body: Optional[ParseableData],
+        query: Optional[QueryString],
+        headers: Headers
+    ) -> Tuple[str, Optional[str]]:
+        """
+        Return a string response body to a request, and an ETag for it, if
+        this Resource computes ETags. Raise NotModified if the request's
+        If-None-Match header matches the ETag.
+        """
+        response = self._compute_open_response(
+            body=body,
+            query=query,
+            headers=headers
+        )
+
+        etag = self.versioned_etag(response)
+        if etag is not None:
+            self.assert_modified(etag, headers)
+
+        if isinstance(response, list):
+            serialised = Encodable.serialise_many(
+                response,
+                serialiser=self._serialiser
+            )
+        else:
+            serialised = self._serialise_response(response)
+
+        if etag is None:
+            etag = self.hashed_etag(serialised)
+            if etag is not None:
+                self.assert_modified(etag, headers)
+
+        return serialised, etag
+
+    def serve_stream(
+        self,
+        body: Optional[ParseableData],
+        query: Optional[QueryString],
+        headers: Headers,
+        format: ContentType = ContentType.JSON
+    ) -> Iterator[str]:
+        """
+        Return an iterator over chunks of a string response body to a
+        request, serialised only as chunks are requested
+        """
+        return self.stream(
+            self._compute_open_response(
+                body=body,
+                query=query,
+                headers=headers
+            ),
+            format=format
+        )
+
+    def _compute_open_response(
+        self,
+        body: Optional[ParseableData],
+        query: Optional[QueryString],
+        headers: Headers
+    ) -> Union[Encodable, List[Encodable]]:
 
         SessionImplementation = self.session_implementation
         ForwardedAgentClass = self.forwarded_agent_implementation
@@ -98,7 +174,4 @@ class OpenResource(Resource):
             unauthorised_agent=requesting_agent
         )
 
-        if isinstance(response, list):
-            return Encodable.serialise_many(response)
-
-        return response.serialise()
+        return response
@@ -9,16 +9,38 @@ from nozomi.http.headers import Headers
 from nozomi.data.datastore import Datastore
 from nozomi.ancillary.immutable import Immutable
 from nozomi.data.encodable import Encodable
+from nozomi.data.abstract_encodable import AbstractEncodable
+from nozomi.data.json_serialiser import JSONSerialiser
 from nozomi.ancillary.configuration import Configuration
-from typing import Any, Optional, Union, List, Dict
+from typing import Any, Optional, Union, List, Dict, Iterator, Iterable
+from typing import Tuple
 from nozomi.security.read_protected import ReadProtected
 from nozomi.security.agent import Agent
 from nozomi.errors.not_authorised import NotAuthorised
 from nozomi.security.broadcastable import Broadcastable
+from nozomi.http.content_type import ContentType
+from nozomi.http.request_schema import RequestSchema, SchemaRecord
+from nozomi.errors.bad_request import BadRequest
+from nozomi.errors.not_modified import NotModified
+import hashlib
 
 
 class Resource:
-    """Abstract class defining machinery for responding to an API request"""
+    """
+    Abstract class defining machinery for responding to an API request.
+
+    Resources may opt in to ETags by overriding `.version_of()`, returning a
+    cheap token identifying the version of a computed response, or by
+    setting `.hashes_etags`, hashing serialised responses. Then
+    `.serve_with_etag()` returns an ETag alongside the response body, and
+    `.serve()` adds it to any `response_headers` supplied, such that it may
+    be sent with a 200 response. Both raise NotModified if the request's
+    If-None-Match header matches, before the response is serialised where
+    a version token is available.
+    """
+
+    request_schema: Optional[RequestSchema] = None
+    hashes_etags: bool = False
 
     def __init__(
         self,
@@ -29,11 +51,13 @@ class Resource:
         self._datastore = datastore
         self._debug = configuration.debug
         self._configuration = configuration
+        self._serialiser = JSONSerialiser.from_configuration(configuration)
         return
 
     datastore = Immutable(lambda s: s._datastore)
     debug = Immutable(lambda s: s._debug)
     configuration = Immutable(lambda s: s._configuration)
+    serialiser = Immutable(lambda s: s._serialiser)
 
     def compute_response(
         self,
@@ -44,18 +68,266 @@ class Resource:
         """Return serialisable response data"""
         raise NotImplementedError
 
+    def parse_body(self, body: Optional[ParseableData]) -> SchemaRecord:
+        """
+        Return a record of the request body parsed under this Resource's
+        `request_schema`, raising a SchemaViolation describing every
+        violation, if any
+        """
+        if self.request_schema is None:
+            raise NotImplementedError('Implement .request_schema')
+        if body is None:
+            raise BadRequest('Expected a key/value object')
+        return self.request_schema.parse(body)
+
     def serve(
         self,
         body: Optional[ParseableData],
         query: Optional[QueryString] = None,
-        headers: Headers = None
+        headers: Headers = None,
+        response_headers: Optional[Headers] = None
     ) -> str:
-        """Return a string response body to a request"""
-        return self.compute_response(
+        """
+        Return a string response body to a request. If this Resource
+        computes ETags, add the ETag to any supplied `response_headers`.
+        """
+        serialised, etag = self.serve_with_etag(body, query, headers)
+        self.add_etag(etag, response_headers)
+        return serialised
+
+    def serve_with_etag(
+        self,
+        body: Optional[ParseableData],
+        query: Optional[QueryString] = None,
+        headers: Headers = None
+    ) -> Tuple[str, Optional[str]]:
+        """
+        Return a string response body to a request, and an ETag for it, if
+        this Resource computes ETags. Raise NotModified if the request's
+        If-None-Match header matches the ETag.
+        """
+        response = self.compute_response(
             body=body,
             query=query,
             headers=headers
-        ).serialise()
+        )
+        etag = self.versioned_etag(response)
+        if etag is not None:
+            self.assert_modified(etag, headers)
+        serialised = self._serialise_response(response)
+        if etag is None:
+            etag = self.hashed_etag(serialised)
+            if etag is not None:
+                self.assert_modified(etag, headers)
+        return serialised, etag
+
+    def version_of(self, response: Any) -> Optional[str]:
+        """
+        Optionally return a token identifying the version of a computed
+        response, such as the time at which an underlying row was last
+        updated, from which an ETag is derived without serialising the
+        response. The token must change whenever the serialised response
+        would. By default, return None.
+        """
+        return None
+
+    def versioned_etag(self, response: Any, *scope: Any) -> Optional[str]:
+        """
+        Return a weak ETag derived from the version of a computed response
+        and any supplied scope, such as the Agent to which it is broadcast,
+        or None if the response is unversioned
+        """
+        token = self.version_of(response)
+        if token is None:
+            return None
+        return 'W/"' + self._digest(repr((str(token),) + scope)) + '"'
+
+    def hashed_etag(self, serialised: str) -> Optional[str]:
+        """
+        Return a strong ETag hashed from a serialised response, if this
+        Resource `.hashes_etags`, else None
+        """
+        if self.hashes_etags is not True:
+            return None
+        return '"' + self._digest(serialised) + '"'
+
+    def _serve_authorised(
+        self,
+        response: Union[Broadcastable, List[Broadcastable]],
+        authorised_agent: Agent,
+        headers: Optional[Headers]
+    ) -> Tuple[str, Optional[str]]:
+        """
+        Return a serialised broadcast of a computed response to an Agent,
+        and an ETag for it, if this Resource computes ETags, asserting that
+        the Agent may read the response once only
+        """
+        etag = self.versioned_etag(response, authorised_agent.agent_id)
+        if etag is not None or not isinstance(response, list):
+            self.assert_read_available_to(
+                unauthorised_agent=authorised_agent,
+                broadcast_candidate=response
+            )
+        if etag is not None:
+            self.assert_modified(etag, headers)
+
+        if not isinstance(response, list):
+            serialised = self._serialise_response(
+                response.broadcast_to(authorised_agent)
+            )
+        elif etag is None:
+            serialised = self._serialiser.serialise_iterable(
+                self.broadcast_each(response, authorised_agent)
+            )
+        else:
+            # Read access to each element was asserted above
+            serialised = self._serialiser.serialise_iterable(
+                c.broadcast_to(authorised_agent) for c in response
+            )
+
+        if etag is None:
+            etag = self.hashed_etag(serialised)
+            if etag is not None:
+                self.assert_modified(etag, headers)
+
+        return serialised, etag
+
+    def _serialise_response(
+        self,
+        response: AbstractEncodable,
+        format: Any = None
+    ) -> str:
+        """
+        Return a serialised response via this Resource's JSONSerialiser.
+        Objects overriding `.serialise()`, which may predate its
+        `serialiser` parameter, are serialised by their override without
+        one, as they were before Resources supplied a serialiser.
+        """
+        arguments = dict() if format is None else {'format': format}
+        if type(response).serialise is Encodable.serialise:
+            return response.serialise(
+                serialiser=self._serialiser,
+                **arguments
+            )
+        return response.serialise(**arguments)
+
+    @staticmethod
+    def add_etag(etag: Optional[str], headers: Optional[Headers]) -> None:
+        """Add an ETag, if any, to response headers, if supplied"""
+        if etag is None or headers is None:
+            return
+        headers.add('ETag', etag)
+        return
+
+    @staticmethod
+    def assert_modified(etag: str, headers: Optional[Headers]) -> None:
+        """
+        Raise NotModified if the If-None-Match header of a request matches
+        the supplied ETag, by weak comparison per RFC 7232
+        """
+        if headers is None:
+            return
+        condition = headers.value_for('If-None-Match')
+        if condition is None:
+            return
+        opaque = etag[2:] if etag.startswith('W/') else etag
+        for candidate in condition.split(','):
+            candidate = candidate.strip()
+            if candidate.startswith('W/'):
+                candidate = candidate[2:]
+            if candidate == opaque or candidate == '*':
+                raise NotModified(etag)
+            continue
+        return
+
+    @staticmethod
+    def _digest(value: str) -> str:
+        return hashlib.blake2b(
+            value.encode('utf-8'),
+            digest_size=16
+        ).hexdigest()
+
+    def serve_stream(
+        self,
+        body: Optional[ParseableData],
+        query: Optional[QueryString] = None,
+        headers: Headers = None,
+        format: ContentType = ContentType.JSON
+    ) -> Iterator[str]:
+        """
+        Return an iterator over chunks of a string response body to a
+        request, suitable for chunked transfer encoding. The response is
+        computed immediately, such that errors are raised before the first
+        chunk is sent, but is serialised only as chunks are requested.
+        """
+        return self.stream(
+            self.compute_response(
+                body=body,
+                query=query,
+                headers=headers
+            ),
+            format=format
+        )
+
+    def stream(
+        self,
+        response: Union[Encodable, Iterable[Encodable]],
+        format: ContentType = ContentType.JSON
+    ) -> Iterator[str]:
+        """
+        Lazily yield chunks of a serialised response of at least
+        `Configuration.stream_chunk_size` characters, bar the last
+        """
+        if isinstance(response, AbstractEncodable):
+            pieces = iter([self._serialise_response(response, format=format)])
+        else:
+            pieces = Encodable.stream_many(
+                response,
+                format=format,
+                serialiser=self._serialiser
+            )
+
+        return self._chunk(pieces, self._configuration.stream_chunk_size)
+
+    @staticmethod
+    def _chunk(pieces: Iterator[str], size: int) -> Iterator[str]:
+        buffer: List[str] = list()
+        buffered = 0
+        for piece in pieces:
+            buffer.append(piece)
+            buffered += len(piece)
+            if buffered >= size:
+                yield ''.join(buffer)
+                buffer = list()
+                buffered = 0
+            continue
+        if buffer:
+            yield ''.join(buffer)
+        return
+
+    def stream_broadcast(
+        self,
+        response: Union[Broadcastable, List[Broadcastable]],
+        agent: Agent,
+        format: ContentType = ContentType.JSON
+    ) -> Iterator[str]:
+        """
+        Return an iterator over chunks of a broadcast of the supplied response
+        to the supplied Agent. Read access is asserted up front, so that a
+        NotAuthorised error cannot interrupt a partially sent response.
+        """
+        self.assert_read_available_to(
+            unauthorised_agent=agent,
+            broadcast_candidate=response
+        )
+
+        if isinstance(response, list):
+            return self.stream(
+                (r.broadcast_to(agent) for r in response),
+                format=format
+            )
+
+        return self.stream(response.broadcast_to(agent), format=format)
 
     def assert_read_available_to(
         self,
@@ -76,6 +348,22 @@ class Resource:
             raise NotAuthorised
         return unauthorised_agent
 
+    def broadcast_each(
+        self,
+        broadcast_candidates: List[Broadcastable],
+        agent: Agent
+    ) -> Iterator[Encodable]:
+        """
+        Lazily yield a broadcast of each candidate to the supplied Agent,
+        raising a NotAuthorised error if the Agent may not read a candidate.
+        Authorisation, broadcast and encoding thereby share a single pass.
+        """
+        for candidate in broadcast_candidates:
+            if not candidate.grants_read_to(agent):
+                raise NotAuthorised
+            yield candidate.broadcast_to(agent)
+        return
+
     class AcknowledgementBroadcast(Broadcastable, Encodable):
         """
         Canned Broadcastable response useful in cases where an acknolwedgement
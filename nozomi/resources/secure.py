@@ -13,11 +13,11 @@ from nozomi.http.query_string import QueryString
 from nozomi.http.headers import Headers
 from nozomi.security.perspective import Perspective
 from nozomi.security.forwarded_agent import ForwardedAgent
-from nozomi.data.encodable import Encodable
-from typing import Optional, Tuple, Set, Type
+from typing import Optional, Tuple, Set, Type, Iterator
 from nozomi.security.abstract_session import AbstractSession
 from nozomi.ancillary.configuration import Configuration
 from nozomi.http.parseable_data import ParseableData
+from nozomi.http.content_type import ContentType
 
 
 class SecureResource(Resource):
@@ -74,8 +74,75 @@ class SecureResource(Resource):
         body: Optional[ParseableData],
         query: Optional[QueryString],
         headers: Headers,
-        session: AbstractSession = None
+        session: AbstractSession = None,
+        response_headers: Optional[Headers] = None
     ) -> str:
+        """
+        Return a string response body to a request. If this Resource
+        computes ETags, add the ETag to any supplied `response_headers`.
+        """
+        serialised, etag = self.serve_with_etag(
+            body=body,
+            query=query,
+            headers=headers,
+            session=session
+        )
+        self.add_etag(etag, response_headers)
+        return serialised
+
+    def serve_with_etag(
+        self,
+        body: Optional[ParseableData],
+        query: Optional[QueryString],
+        headers: Headers,
+        session: AbstractSession = None
+    ) -> Tuple[str, Optional[str]]:
+        """
+        Return a string response body to a request, and an ETag for it, if
+        this Resource computes ETags. Raise NotModified if the request's
+        If-None-Match header matches the ETag.
+        """
+        response, authorised_agent = self._compute_authorised_response(
+            body=body,
+            query=query,
+            headers=headers,
+            session=session
+        )
+
+        return self._serve_authorised(response, authorised_agent, headers)
+
+    def serve_stream(
+        self,
+        body: Optional[ParseableData],
+        query: Optional[QueryString],
+        headers: Headers,
+        session: AbstractSession = None,
+        format: ContentType = ContentType.JSON
+    ) -> Iterator[str]:
+        """
+        Return an iterator over chunks of a string response body to a
+        request, broadcast and serialised only as chunks are requested
+        """
+        response, authorised_agent = self._compute_authorised_response(
+            body=body,
+            query=query,
+            headers=headers,
+            session=session
+        )
+
+        return self.stream_broadcast(
+            response,
+            authorised_agent,
+            format=format
+        )
+
+    def _compute_authorised_response(
+        self,
+        body: Optional[ParseableData],
+        query: Optional[QueryString],
+        headers: Headers,
+        session: Optional[AbstractSession]
+    ) -> Tuple[Union[Broadcastable, List[Broadcastable]], Agent]:
 
         SessionImplementation = self.session_implementation
         ForwardedAgentImplementation = self.forwarded_agent_implementation
@@ -129,14 +196,4 @@ class SecureResource(Resource):
                 raise NotAuthorised
             assert authorised_agent == session.agent
 
-        self.assert_read_available_to(
-            unauthorised_agent=authorised_agent,
-            broadcast_candidate=response
-        )
-
-        if isinstance(response, list):
-            return Encodable.serialise_many(
-                Broadcastable.broadcast_many_to(response, authorised_agent)
-            )
-
-        return response.broadcast_to(authorised_agent).serialise()
+        return response, authorised_agent
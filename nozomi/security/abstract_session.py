@@ -7,10 +7,16 @@ from nozomi.data.decodable import Decodable
 from nozomi.security.agent import Agent
 from nozomi.ancillary.immutable import Immutable
 from nozomi.security.perspective import Perspective
-from typing import TypeVar
+from nozomi.security.session_touch_buffer import SessionTouchBuffer, Touch
+from nozomi.data.pooled_datastore import PooledDatastore
+from typing import TypeVar, Any, List, Optional
+from functools import partial
+import threading
 
 T = TypeVar('T', bound='AbstractSession')
 
+_BUFFER_LOCK = threading.Lock()
+
 
 class AbstractSession(Decodable, Agent):
 
@@ -23,3 +29,75 @@ class AbstractSession(Decodable, Agent):
     agent_confirmed: bool = NotImplemented
 
     agent_id = Immutable(lambda s: s._agent.agent_id)
+
+    _touch_buffer: Optional[SessionTouchBuffer] = None
+
+    def touch(
+        self,
+        configuration: Any,
+        datastore: Optional[PooledDatastore] = None
+    ) -> None:
+        """
+        Record that this Session has been utilised, such that its
+        last-utilised time may be written behind in a batch. Has no effect
+        unless `Configuration.session_write_behind_milliseconds` is non-zero
+        and the implementing class overrides `.write_touches()`.
+
+        Touches are written via the PooledDatastore supplied with the first
+        touch, from the writing thread.
+        """
+        touch_buffer = type(self).touch_buffer(configuration, datastore)
+        if touch_buffer is None:
+            return
+        touch_buffer.touch(self.session_id)
+        return
+
+    @classmethod
+    def touch_buffer(
+        cls,
+        configuration: Any,
+        datastore: Optional[PooledDatastore] = None
+    ) -> Optional[SessionTouchBuffer]:
+        """
+        Return this class' SessionTouchBuffer, if write-behind is enabled,
+        creating it to write via the supplied datastore if need be
+        """
+        if not configuration.session_write_behind_milliseconds:
+            return None
+        write_touches = cls.write_touches.__func__
+        if write_touches is AbstractSession.write_touches.__func__:
+            return None
+        touch_buffer = cls.__dict__.get('_touch_buffer')
+        if touch_buffer is not None:
+            return touch_buffer
+        if datastore is None:
+            return None
+        if not isinstance(datastore, PooledDatastore):
+            raise TypeError('Session write-behind requires a PooledDatastore, \
+which may be used from the writing thread')
+        with _BUFFER_LOCK:
+            touch_buffer = cls.__dict__.get('_touch_buffer')
+            if touch_buffer is None:
+                touch_buffer = SessionTouchBuffer(
+                    write=partial(cls.write_touches, configuration, datastore),
+                    interval_milliseconds=(
+                        configuration.session_write_behind_milliseconds
+                    ),
+                    capacity=configuration.session_write_behind_capacity
+                )
+                cls._touch_buffer = touch_buffer
+        return touch_buffer
+
+    @classmethod
+    def write_touches(
+        cls,
+        configuration: Any,
+        datastore: PooledDatastore,
+        touches: List[Touch]
+    ) -> None:
+        """
+        Write a batch of `(session_id, last_utilised)` touches to persistent
+        storage via the supplied datastore. Called from a SessionTouchBuffer
+        thread.
+        """
+        raise NotImplementedError
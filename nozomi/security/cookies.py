@@ -11,45 +11,55 @@ T = TypeVar('T', bound='Cookies')
 
 
 class Cookies:
-    """An instance of a set of cookies sent by a client"""
+    """
+    An instance of a set of cookies sent by a client. Cookies are parsed
+    lazily, on first use, and malformed cookies are ignored. Optionally,
+    supply cookies already parsed from `raw_cookies`, such that they are
+    not parsed again.
+    """
 
-    def __init__(self, raw_cookies: str) -> None:
+    def __init__(
+        self,
+        raw_cookies: str,
+        parsed: Optional[Dict[str, str]] = None
+    ) -> None:
 
-        self._cookies: Dict[str, str] = dict()
         self._raw_cookies = raw_cookies
-
-        if raw_cookies is None:
-            return
-
-        for cookie in raw_cookies.split(';'):
-            pieces = cookie.strip().split('=')
-            try:
-                self._cookies[pieces[0]] = pieces[1]
-            except IndexError:
-                raise RuntimeError('Invalid cookies supplied')
+        self._parsed = parsed
 
         return
 
-    is_empty: bool = Immutable(lambda s: len(s._cookies) < 1)
+    is_empty: bool = Immutable(lambda s: len(s._cookies()) < 1)
+
+    def _cookies(self) -> Dict[str, str]:
+        if self._parsed is not None:
+            return self._parsed
+        if self._raw_cookies is None:
+            self._parsed = dict()
+            return self._parsed
+        self._parsed = Headers.parse_cookies(self._raw_cookies)
+        return self._parsed
 
     def contains(self, cookie_name: str) -> bool:
         """Return true if the jar contains the specified cookie"""
-        if cookie_name in self._cookies.keys():
-            return True
-        return False
+        return cookie_name in self._cookies()
 
     def value_for(self, cookie_name: str) -> str:
         """
         Return the value of a specified cookie
         """
-        if self.contains(cookie_name) is False:
+        try:
+            return self._cookies()[cookie_name]
+        except KeyError:
             raise ValueError('Cookie with specified name does not exist')
-        return self._cookies[cookie_name]
 
     @classmethod
     def from_headers(cls: Type[T], headers: Headers) -> Optional[T]:
-        """Return Cookies parsed from request headers"""
+        """
+        Return Cookies parsed from request headers. Parsing is performed
+        once per Headers instance, however many times this is called.
+        """
         raw_cookies = headers.value_for('Cookie')
         if raw_cookies is None:
             return None
-        return cls(raw_cookies)
+        return cls(raw_cookies, parsed=headers.cookies())
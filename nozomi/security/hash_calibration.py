@@ -0,0 +1,45 @@
+"""
+Nozomi
+Hash Calibration Module
+Copyright Amatino Pty Ltd
+
+Benchmark Argon2 on this host and propose HashParameters for a target
+latency. Usage:
+
+    python -m nozomi.security.hash_calibration [--target-ms 250]
+        [--memory-kib 65536] [--parallelism 2]
+"""
+from nozomi.ancillary.command_line import CommandLine
+from nozomi.security.hash_parameters import HashParameters
+
+
+def main() -> None:
+
+    command_line = CommandLine.load()
+    target_milliseconds = command_line.optionally_parse_int(
+        '--target-ms',
+        min_value=1
+    ) or 250
+
+    proposal = HashParameters.calibrate(
+        target_milliseconds=target_milliseconds,
+        memory_cost=command_line.optionally_parse_int(
+            '--memory-kib',
+            min_value=8
+        ) or 65536,
+        parallelism=command_line.optionally_parse_int(
+            '--parallelism',
+            min_value=1
+        ) or 2
+    )
+
+    print('Proposed parameters: ' + str(proposal))
+    print('Median hash time: {t:.1f}ms (target {g}ms)'.format(
+        t=proposal.time_hash() * 1000,
+        g=str(target_milliseconds)
+    ))
+    return
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,181 @@
+"""
+Nozomi
+Hash Parameters Module
+Copyright Amatino Pty Ltd
+"""
+from nozomi.ancillary.immutable import Immutable
+from typing import TypeVar, Type, Optional, Any, List
+import statistics
+import time
+
+try:
+    import argon2
+except ImportError:
+    argon2 = None
+
+T = TypeVar('T', bound='HashParameters')
+
+
+class HashParameters:
+    """
+    Argon2 cost parameters. Hashes record the parameters used to compute
+    them in PHC string format, for example
+    `$argon2i$v=19$m=64,t=10,p=2$<salt>$<hash>`, such that hashes computed
+    under older parameters remain verifiable.
+
+    To propose parameters suited to a host, run:
+
+        python -m nozomi.security.hash_calibration --target-ms 250
+    """
+
+    _VARIANTS = ('argon2i', 'argon2d', 'argon2id')
+
+    def __init__(
+        self,
+        time_cost: int,
+        memory_cost: int,
+        parallelism: int,
+        hash_length: int = 48,
+        variant: str = 'argon2i'
+    ) -> None:
+
+        assert isinstance(time_cost, int)
+        assert isinstance(memory_cost, int)
+        assert isinstance(parallelism, int)
+        assert isinstance(hash_length, int)
+        if variant not in self._VARIANTS:
+            raise ValueError('Unknown Argon2 variant: ' + str(variant))
+
+        self._time_cost = time_cost
+        self._memory_cost = memory_cost
+        self._parallelism = parallelism
+        self._hash_length = hash_length
+        self._variant = variant
+
+        return
+
+    time_cost: int = Immutable(lambda s: s._time_cost)
+    memory_cost: int = Immutable(lambda s: s._memory_cost)
+    parallelism: int = Immutable(lambda s: s._parallelism)
+    hash_length: int = Immutable(lambda s: s._hash_length)
+    variant: str = Immutable(lambda s: s._variant)
+
+    argon2_type = Immutable(lambda s: s._argon2_type())
+
+    def _argon2_type(self) -> Any:
+        if not argon2:
+            raise NotImplementedError('Install argon2-cffi')
+        if self._variant == 'argon2d':
+            return argon2.Type.D
+        if self._variant == 'argon2id':
+            return argon2.Type.ID
+        return argon2.Type.I
+
+    def hash(self, raw_secret: bytes, salt: bytes) -> str:
+        """Return a PHC format Argon2 hash computed under these parameters"""
+        if not argon2:
+            raise NotImplementedError('Install argon2-cffi')
+        return argon2.low_level.hash_secret(
+            raw_secret,
+            salt=salt,
+            time_cost=self._time_cost,
+            memory_cost=self._memory_cost,
+            parallelism=self._parallelism,
+            hash_len=self._hash_length,
+            type=self.argon2_type
+        ).decode('utf-8')
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, HashParameters):
+            return False
+        return (
+            self._time_cost == other._time_cost
+            and self._memory_cost == other._memory_cost
+            and self._parallelism == other._parallelism
+            and self._hash_length == other._hash_length
+            and self._variant == other._variant
+        )
+
+    def __hash__(self) -> int:
+        return hash((
+            self._time_cost,
+            self._memory_cost,
+            self._parallelism,
+            self._hash_length,
+            self._variant
+        ))
+
+    def __str__(self) -> str:
+        return '{v} m={m},t={t},p={p} hash_length={h}'.format(
+            v=self._variant,
+            m=str(self._memory_cost),
+            t=str(self._time_cost),
+            p=str(self._parallelism),
+            h=str(self._hash_length)
+        )
+
+    @classmethod
+    def optionally_from_hash(cls: Type[T], hashed: str) -> Optional[T]:
+        """
+        Return the parameters recorded in a PHC format Argon2 hash, or None
+        if the hash cannot be parsed
+        """
+        pieces = hashed.split('$')
+        if len(pieces) != 6 or pieces[1] not in cls._VARIANTS:
+            return None
+        try:
+            costs = dict(p.split('=', 1) for p in pieces[3].split(','))
+            encoded_length = len(pieces[5].rstrip('='))
+            return cls(
+                time_cost=int(costs['t']),
+                memory_cost=int(costs['m']),
+                parallelism=int(costs['p']),
+                hash_length=(encoded_length * 3) // 4,
+                variant=pieces[1]
+            )
+        except (KeyError, ValueError):
+            return None
+
+    def time_hash(self, samples: int = 5) -> float:
+        """
+        Return the median number of seconds taken to compute a hash under
+        these parameters on this host
+        """
+        durations: List[float] = list()
+        for _ in range(samples):
+            start = time.perf_counter()
+            self.hash(b'nozomi-calibration', b'nozomi-calibration-salt')
+            durations.append(time.perf_counter() - start)
+            continue
+        return statistics.median(durations)
+
+    @classmethod
+    def calibrate(
+        cls: Type[T],
+        target_milliseconds: float,
+        memory_cost: int = 65536,
+        parallelism: int = 2,
+        hash_length: int = 48,
+        variant: str = 'argon2i',
+        samples: int = 5
+    ) -> T:
+        """
+        Return parameters using the supplied memory cost and parallelism,
+        with the greatest time cost computing a hash within the target
+        latency on this host, and at least a time cost of 1
+        """
+        target = target_milliseconds / 1000
+        proposal = cls(1, memory_cost, parallelism, hash_length, variant)
+        while True:
+            candidate = cls(
+                proposal.time_cost + 1,
+                memory_cost,
+                parallelism,
+                hash_length,
+                variant
+            )
+            if candidate.time_hash(samples) > target:
+                return proposal
+            proposal = candidate
+            continue
+
@@ -0,0 +1,94 @@
+"""
+Nozomi
+Hashing Pool Module
+Copyright Amatino Pty Ltd
+"""
+from nozomi.ancillary.immutable import Immutable
+from nozomi.errors.too_many_requests import TooManyRequests
+from concurrent.futures import ProcessPoolExecutor, Future
+from typing import Any, Callable, Optional, TypeVar, Type
+import threading
+import asyncio
+import os
+
+T = TypeVar('T', bound='HashingPool')
+
+_SHARED_LOCK = threading.Lock()
+
+
+class HashingPool:
+    """
+    A bounded pool of processes computing passphrase hashes away from
+    request threads. At most `processes` hashes are computed at once, and
+    up to `max_queued` further submissions wait their turn. Submissions
+    beyond that limit raise TooManyRequests, such that a spike in login
+    attempts queues briefly rather than overloading the host.
+
+    Submitted functions and their arguments must be picklable.
+    """
+
+    _shared: Optional['HashingPool'] = None
+
+    def __init__(
+        self,
+        processes: Optional[int] = None,
+        max_queued: int = 64
+    ) -> None:
+
+        if processes is None:
+            processes = os.cpu_count() or 1
+
+        assert isinstance(processes, int)
+        assert isinstance(max_queued, int)
+        assert processes > 0
+        assert max_queued >= 0
+
+        self._processes = processes
+        self._max_queued = max_queued
+        self._admission = threading.BoundedSemaphore(processes + max_queued)
+        self._executor = ProcessPoolExecutor(max_workers=processes)
+
+        return
+
+    processes: int = Immutable(lambda s: s._processes)
+    max_queued: int = Immutable(lambda s: s._max_queued)
+
+    def submit(self, function: Callable, *arguments: Any) -> Future:
+        """
+        Return a Future computing the supplied function in a pooled
+        process, raising TooManyRequests if the pool's queue is full
+        """
+        if not self._admission.acquire(blocking=False):
+            raise TooManyRequests
+        try:
+            future = self._executor.submit(function, *arguments)
+        except BaseException:
+            self._admission.release()
+            raise
+        future.add_done_callback(lambda _: self._admission.release())
+        return future
+
+    def compute(self, function: Callable, *arguments: Any) -> Any:
+        """Return the result of the supplied function, computed in the pool"""
+        return self.submit(function, *arguments).result()
+
+    async def compute_async(self, function: Callable, *arguments: Any) -> Any:
+        """
+        Return the result of the supplied function, computed in the pool
+        without blocking the running event loop
+        """
+        return await asyncio.wrap_future(self.submit(function, *arguments))
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
+        return
+
+    @classmethod
+    def shared(cls: Type[T]) -> T:
+        """Return a process-wide pool, creating it with defaults if need be"""
+        if cls._shared is not None:
+            return cls._shared
+        with _SHARED_LOCK:
+            if cls._shared is None:
+                cls._shared = cls()
+        return cls._shared
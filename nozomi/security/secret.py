@@ -7,27 +7,36 @@ import hmac
 from nozomi.ancillary.immutable import Immutable
 from nozomi.errors.error import NozomiError
 from nozomi.security.salt import Salt
+from nozomi.security.hashing_pool import HashingPool
+from nozomi.security.hash_parameters import HashParameters
 from nozomi.data.datastore import Datastore
 from typing import TypeVar, Type, Optional
 from nozomi.data.query import Query
 
 
-try:
-    import argon2
-except ImportError:
-    argon2 = None
-
-
 T = TypeVar('T', bound='Secret')
 
 
 class Secret:
     """
-    A user's secret passphrase
+    A user's secret passphrase. New hashes are computed under
+    `Secret.hash_parameters`, which a deployment may replace with
+    parameters calibrated for its hosts. Existing hashes are verified
+    under the parameters recorded within them, and may be upgraded to the
+    current parameters on login via `.upgrade()`.
     """
     _Q_RETRIEVE_BY_EMAIL = Query.optionally_from_file(
         'queries/secret/retrieve.sql'
     )
+    _Q_UPDATE = Query.optionally_from_file('queries/secret/update.sql')
+
+    hash_parameters = HashParameters(
+        time_cost=10,
+        memory_cost=64,
+        parallelism=2,
+        hash_length=48,
+        variant='argon2i'
+    )
 
     def __init__(
         self,
@@ -49,6 +58,13 @@ class Secret:
     hashed_passphrase = Immutable(lambda s: s._hashed_passphrase)
     salt = Immutable(lambda s: s._salt.string)
     agent_id = Immutable(lambda s: s._agent_id)
+    parameters: HashParameters = Immutable(
+        lambda s: HashParameters.optionally_from_hash(s._hashed_passphrase)
+        or type(s).hash_parameters
+    )
+    needs_rehash: bool = Immutable(
+        lambda s: s.parameters != type(s).hash_parameters
+    )
 
     Q_RETRIEVE_BY_EMAIL = Immutable(lambda s: s._load_query(
         s._Q_RETRIEVE_BY_EMAIL
@@ -61,29 +77,65 @@ class Secret:
         return query
 
     @classmethod
-    def _compute_hash(cls: Type[T], raw_secret: str, salt: Salt) -> str:
-        """Compute the Argon2 hash of the provided secret"""
+    def _compute_hash(
+        cls: Type[T],
+        raw_secret: str,
+        salt: Salt,
+        parameters: Optional[HashParameters] = None
+    ) -> str:
+        """
+        Compute the Argon2 hash of the provided secret, by default under
+        the current hash parameters
+        """
         assert isinstance(raw_secret, str)
         assert isinstance(salt, Salt)
-        if not argon2:
-            raise NotImplementedError('Install argon2-cffi')
-        computed_hash = argon2.low_level.hash_secret(
-            raw_secret.encode('utf-8'),
-            salt=salt.utf8_bytes,
-            time_cost=10,
-            memory_cost=64,
-            parallelism=2,
-            hash_len=48,
-            type=argon2.Type.I
-        ).decode('utf-8')
-        return computed_hash
+        parameters = parameters or cls.hash_parameters
+        return parameters.hash(raw_secret.encode('utf-8'), salt.utf8_bytes)
 
     def matches(self, plaintext_passphrase: str) -> bool:
         """Return True if the supplied passphrase matches this one"""
         supplied_secret_hash = self._compute_hash(
             plaintext_passphrase,
-            self._salt
+            self._salt,
+            self.parameters
         )
+        return self._matches_hash(supplied_secret_hash)
+
+    def matches_in_pool(
+        self,
+        plaintext_passphrase: str,
+        pool: Optional[HashingPool] = None
+    ) -> bool:
+        """
+        Return True if the supplied passphrase matches this one, computing
+        its hash in a HashingPool, by default the shared pool
+        """
+        pool = pool or HashingPool.shared()
+        return self._matches_hash(pool.compute(
+            type(self)._compute_hash,
+            plaintext_passphrase,
+            self._salt,
+            self.parameters
+        ))
+
+    async def matches_async(
+        self,
+        plaintext_passphrase: str,
+        pool: Optional[HashingPool] = None
+    ) -> bool:
+        """
+        Return True if the supplied passphrase matches this one, awaiting
+        computation of its hash in a HashingPool, by default the shared pool
+        """
+        pool = pool or HashingPool.shared()
+        return self._matches_hash(await pool.compute_async(
+            type(self)._compute_hash,
+            plaintext_passphrase,
+            self._salt,
+            self.parameters
+        ))
+
+    def _matches_hash(self, supplied_secret_hash: str) -> bool:
         comparison = hmac.compare_digest(
             supplied_secret_hash,
             self._hashed_passphrase
@@ -102,6 +154,80 @@ class Secret:
         hashed_passphrase = cls._compute_hash(plaintext_passphrase, salt)
         return cls(salt, hashed_passphrase)
 
+    @classmethod
+    def create_from_plaintext_in_pool(
+        cls: Type[T],
+        plaintext_passphrase: str,
+        pool: Optional[HashingPool] = None
+    ) -> T:
+        """
+        Return a Secret created based on the supplied plaintext passphrase,
+        computing its hash in a HashingPool, by default the shared pool,
+        under the current hash parameters of this process
+        """
+        if not isinstance(plaintext_passphrase, str):
+            raise NozomiError('Passphrases must be strings', 400)
+        pool = pool or HashingPool.shared()
+        salt = Salt.create()
+        hashed_passphrase = pool.compute(
+            cls._compute_hash,
+            plaintext_passphrase,
+            salt,
+            cls.hash_parameters
+        )
+        return cls(salt, hashed_passphrase)
+
+    @classmethod
+    async def create_from_plaintext_async(
+        cls: Type[T],
+        plaintext_passphrase: str,
+        pool: Optional[HashingPool] = None
+    ) -> T:
+        """
+        Return a Secret created based on the supplied plaintext passphrase,
+        awaiting computation of its hash in a HashingPool, by default the
+        shared pool, under the current hash parameters of this process
+        """
+        if not isinstance(plaintext_passphrase, str):
+            raise NozomiError('Passphrases must be strings', 400)
+        pool = pool or HashingPool.shared()
+        salt = Salt.create()
+        hashed_passphrase = await pool.compute_async(
+            cls._compute_hash,
+            plaintext_passphrase,
+            salt,
+            cls.hash_parameters
+        )
+        return cls(salt, hashed_passphrase)
+
+    def upgrade(
+        self,
+        plaintext_passphrase: str,
+        datastore: Datastore
+    ) -> Optional[T]:
+        """
+        Return a replacement Secret hashed under the current parameters,
+        after storing it via `queries/secret/update.sql`, if this Secret
+        needs rehashing. Call only after the supplied passphrase has been
+        found to match. Returns None if no upgrade is needed or possible.
+        """
+        if self.needs_rehash is False:
+            return None
+        if self._Q_UPDATE is None or self._agent_id is None:
+            return None
+        salt = Salt.create()
+        upgraded = type(self)(
+            salt=salt,
+            hashed_passphrase=self._compute_hash(plaintext_passphrase, salt),
+            agent_id=self._agent_id
+        )
+        self._Q_UPDATE.execute(datastore, {
+            'agent': self._agent_id,
+            'salt': upgraded.salt,
+            'secret_hash': upgraded.hashed_passphrase
+        })
+        return upgraded
+
     @classmethod
     def retrieve_for_user_id(cls: Type[T], user_id: int) -> T:
         """Return the active Secret for a given User ID"""
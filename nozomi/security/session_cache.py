@@ -0,0 +1,189 @@
+"""
+Nozomi
+Session Cache Module
+Copyright Amatino Pty Ltd
+"""
+from nozomi.ancillary.immutable import Immutable
+from nozomi.ancillary.database_credentials import DatabaseCredentials
+from nozomi.security.abstract_session import AbstractSession
+from nozomi.data.datastore import Datastore
+from collections import OrderedDict
+from typing import Optional, Type, TypeVar, Any
+import threading
+import select
+import copy
+import time
+
+try:
+    import psycopg2
+    from psycopg2.extensions import quote_ident
+except ImportError:
+    psycopg2 = None
+    quote_ident = None
+
+T = TypeVar('T', bound='SessionCache')
+
+
+class SessionCache:
+    """
+    A threadsafe, in-process cache of Sessions keyed by session id. Entries
+    expire `seconds_to_live` seconds after they are added, and the least
+    recently used entry is evicted once `capacity` is exceeded. Sessions
+    are copied in and out of the cache, such that no two callers share an
+    instance.
+
+    A cache only stores retrieved Sessions. Callers remain responsible for
+    authenticating the credentials supplied with each request against a
+    cached Session.
+
+    Caches in other processes may be kept coherent by calling `.notify()`
+    whenever a Session is deleted, and `.listen()` in each process.
+    """
+
+    def __init__(
+        self,
+        seconds_to_live: float,
+        capacity: int = 1024
+    ) -> None:
+
+        assert isinstance(seconds_to_live, (int, float))
+        assert isinstance(capacity, int)
+        assert capacity > 0
+
+        self._seconds_to_live = seconds_to_live
+        self._capacity = capacity
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+        return
+
+    seconds_to_live: float = Immutable(lambda s: s._seconds_to_live)
+    capacity: int = Immutable(lambda s: s._capacity)
+
+    def get(self, session_id: str) -> Optional[AbstractSession]:
+        """
+        Return a cached Session, if it is present and has not expired,
+        marking it as recently used
+        """
+        with self._lock:
+            entry = self._entries.get(session_id)
+            if entry is None:
+                return None
+            expiry, session = entry
+            if expiry <= time.monotonic():
+                del self._entries[session_id]
+                return None
+            self._entries.move_to_end(session_id)
+        return copy.copy(session)
+
+    def add(self, session: AbstractSession) -> None:
+        """Cache a Session, evicting the least recently used if full"""
+        expiry = time.monotonic() + self._seconds_to_live
+        session = copy.copy(session)
+        with self._lock:
+            self._entries[session.session_id] = (expiry, session)
+            self._entries.move_to_end(session.session_id)
+            while len(self._entries) > self._capacity:
+                self._entries.popitem(last=False)
+                continue
+        return
+
+    def invalidate(self, session_id: str) -> None:
+        """Remove a Session from the cache, if present"""
+        with self._lock:
+            self._entries.pop(session_id, None)
+        return
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+        return
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def notify(datastore: Datastore, channel: str, session_id: str) -> None:
+        """
+        Notify caches listening on the supplied channel that a Session
+        has been invalidated
+        """
+        datastore.execute(
+            'select pg_notify(%(channel)s, %(session_id)s)',
+            {'channel': channel, 'session_id': session_id},
+            atomic=True
+        )
+        return
+
+    def listen(
+        self,
+        credentials: DatabaseCredentials,
+        channel: str,
+        timeout: float = 5
+    ) -> threading.Thread:
+        """
+        Start a daemon thread invalidating cached Sessions named in
+        notifications received on the supplied channel. The cache is cleared
+        whenever the listening connection is (re)established, as
+        notifications may have been missed in the interim.
+        """
+        if not psycopg2:
+            raise NotImplementedError('Install Psycopg2')
+
+        thread = threading.Thread(
+            target=self._listen,
+            args=(credentials, channel, timeout),
+            name='nozomi-session-cache-' + channel,
+            daemon=True
+        )
+        thread.start()
+        return thread
+
+    def _listen(
+        self,
+        credentials: DatabaseCredentials,
+        channel: str,
+        timeout: float
+    ) -> None:
+
+        while True:
+            connection: Any = None
+            try:
+                connection = psycopg2.connect(credentials.dsn_string)
+                connection.autocommit = True
+                with connection.cursor() as cursor:
+                    cursor.execute('LISTEN ' + quote_ident(channel, cursor))
+                self.clear()
+                while True:
+                    if select.select([connection], [], [], timeout)[0]:
+                        connection.poll()
+                    while connection.notifies:
+                        self.invalidate(connection.notifies.pop(0).payload)
+                        continue
+                    continue
+            except (psycopg2.OperationalError, psycopg2.InterfaceError):
+                self.clear()
+                if connection is not None:
+                    connection.close()
+                time.sleep(timeout)
+            continue
+
+    @classmethod
+    def from_configuration(cls: Type[T], configuration: Any) -> T:
+        """
+        Return a cache whose entries never outlive the configured Session
+        lifetime, listening for invalidations if a channel is configured
+        """
+        cache = cls(
+            seconds_to_live=min(
+                configuration.session_cache_seconds,
+                configuration.session_seconds_to_live
+            ),
+            capacity=configuration.session_cache_capacity
+        )
+        if configuration.session_cache_channel is not None:
+            cache.listen(
+                configuration.database_credentials,
+                configuration.session_cache_channel
+            )
+        return cache
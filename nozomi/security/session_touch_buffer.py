@@ -0,0 +1,127 @@
+"""
+Nozomi
+Session Touch Buffer Module
+Copyright Amatino Pty Ltd
+"""
+from nozomi.ancillary.immutable import Immutable
+from typing import Any, Callable, Dict, List, Tuple, Optional
+import datetime
+import threading
+import logging
+import atexit
+
+Touch = Tuple[Any, datetime.datetime]
+
+
+class SessionTouchBuffer:
+    """
+    A write-behind buffer of the times at which Sessions were last utilised.
+    Touches are collected in memory, keeping the latest per session id, and
+    passed to a supplied `write` function as a list of
+    `(session_id, last_utilised)` tuples every `interval_milliseconds`, or
+    sooner once `capacity` sessions are pending, and finally at exit.
+
+    Writes occur on a dedicated daemon thread, such that requests touching
+    a Session never wait on the database. Touches that fail to write are
+    retained for the next attempt, unless superseded, and the failure is
+    passed to `on_error`, which by default logs it.
+    """
+
+    def __init__(
+        self,
+        write: Callable[[List[Touch]], None],
+        interval_milliseconds: int = 1000,
+        capacity: int = 1000,
+        on_error: Optional[Callable[[Exception], None]] = None
+    ) -> None:
+
+        assert isinstance(interval_milliseconds, int)
+        assert isinstance(capacity, int)
+        assert interval_milliseconds > 0
+        assert capacity > 0
+
+        self._write = write
+        self._interval = interval_milliseconds / 1000
+        self._capacity = capacity
+        self._on_error = on_error or self._log_error
+        self._pending: Dict[Any, datetime.datetime] = dict()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run,
+            name='nozomi-session-touch-buffer',
+            daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.close)
+
+        return
+
+    capacity: int = Immutable(lambda s: s._capacity)
+
+    def touch(
+        self,
+        session_id: Any,
+        time: Optional[datetime.datetime] = None
+    ) -> None:
+        """Record that a Session was utilised, by default at present"""
+        if time is None:
+            time = datetime.datetime.now(datetime.timezone.utc)
+        with self._lock:
+            self._pending[session_id] = time
+            full = len(self._pending) >= self._capacity
+        if full is True:
+            self._wake.set()
+        return
+
+    def flush(self) -> None:
+        """Write all pending touches immediately, on the calling thread"""
+        with self._lock:
+            touches = list(self._pending.items())
+            self._pending = dict()
+        if not touches:
+            return
+        try:
+            self._write(touches)
+        except Exception:
+            with self._lock:
+                for session_id, time in touches:
+                    self._pending.setdefault(session_id, time)
+                    continue
+            raise
+        return
+
+    def close(self) -> None:
+        """Stop the writing thread and write any pending touches"""
+        if self._closed is True:
+            return
+        self._closed = True
+        self._wake.set()
+        self._thread.join()
+        self.flush()
+        return
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def _run(self) -> None:
+        while self._closed is False:
+            self._wake.wait(self._interval)
+            self._wake.clear()
+            if self._closed is True:
+                break
+            try:
+                self.flush()
+            except Exception as error:
+                self._on_error(error)
+            continue
+        return
+
+    def _log_error(self, error: Exception) -> None:
+        logging.getLogger(__name__).error(
+            'Failed to write %d Session touches, which will be retried',
+            len(self._pending),
+            exc_info=error
+        )
+        return
@@ -42,6 +42,10 @@ setup(
     long_description_content_type="text/markdown",
     python_requires='>=3.6',
     install_requires=[],
+    extras_require={
+        'orjson': ['orjson'],
+        'ujson': ['ujson']
+    },
     project_urls={
         'Github Repository': 'https://github.com/amatino-code/nozomi',
         'About': 'https://github.com/amatino-code/nozomi'